@@ -20,17 +20,17 @@ async def main():
             return
             
         # Enable torque
-        servo.enable_torque()
+        await servo.enable_torque()
         
         # Move to different positions
         positions = [0, 90, 180, 90, 0]
         for pos in positions:
             print(f"Moving to {pos} degrees...")
-            servo.set_position(pos)
+            await servo.set_position(pos)
             await controller.wait_for_servos()
             
             # Read current position
-            current_pos = servo.get_position()
+            current_pos = await servo.get_position()
             print(f"Current position: {current_pos:.1f} degrees")
             await asyncio.sleep(1.0)
             
@@ -27,14 +27,14 @@ async def main():
             print(f"Moving to {pos} degrees with {current}mA current limit...")
             
             # Set position with current limit
-            servo.set_current_based_position(pos, current)
+            await servo.set_current_based_position(pos, current)
             
             # Wait for movement to complete
             await controller.wait_for_servos()
             
             # Read current position and actual current
-            actual_pos = servo.get_position()
-            actual_current = servo.get_current()
+            actual_pos = await servo.get_position()
+            actual_current = await servo.get_current()
             print(f"Position: {actual_pos:.1f}°, Current: {actual_current:.1f}mA")
             
             # Small delay between movements
@@ -0,0 +1,42 @@
+"""Example of driving servos on two buses (one USB adapter per arm) concurrently."""
+
+import asyncio
+from dynamixel_async import DynamixelController, fan_out
+
+
+async def main():
+    # One controller per USB adapter; each bus is independent
+    controllers = [
+        DynamixelController(port="/dev/ttyUSB0", baudrate=57600),
+        DynamixelController(port="/dev/ttyUSB1", baudrate=57600)
+    ]
+    
+    try:
+        await asyncio.gather(*(controller.connect() for controller in controllers))
+        for controller in controllers:
+            print(f"{controller.port}: servos {controller.get_connected_ids()}")
+            
+        await fan_out(controllers, lambda servo: servo.enable_torque())
+        
+        # Move both arms at once, then wait for both buses to settle
+        for pos in [90, 180, 270, 180]:
+            print(f"Moving all servos to {pos} degrees...")
+            await fan_out(controllers, lambda servo: servo.set_position(pos))
+            await asyncio.gather(*(controller.wait_for_servos() for controller in controllers))
+            
+            positions = await fan_out(controllers, lambda servo: servo.get_position())
+            for controller, arm_positions in zip(controllers, positions):
+                print(f"{controller.port}: {[f'{p:.1f}' for p in arm_positions]}")
+                
+        await fan_out(controllers, lambda servo: servo.disable_torque())
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        
+    finally:
+        for controller in controllers:
+            await controller.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
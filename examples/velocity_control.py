@@ -20,20 +20,20 @@ async def main():
             return
             
         # Set to velocity mode
-        servo.set_operating_mode(OperatingMode.VELOCITY)
-        servo.enable_torque()
+        await servo.set_operating_mode(OperatingMode.VELOCITY)
+        await servo.enable_torque()
         
         # Rotate at different speeds
         speeds = [10, 20, 30, 0, -10, -20, -30, 0]  # RPM
         for speed in speeds:
             print(f"Setting velocity to {speed} RPM...")
-            servo.set_velocity(speed)
+            await servo.set_velocity(speed)
             
             # Run for 2 seconds
             await asyncio.sleep(2.0)
             
             # Read current velocity
-            current_speed = servo.get_velocity()
+            current_speed = await servo.get_velocity()
             print(f"Current velocity: {current_speed:.1f} RPM")
             
     except Exception as e:
@@ -42,7 +42,7 @@ async def main():
     finally:
         # Stop and clean up
         if servo:
-            servo.set_velocity(0)
+            await servo.set_velocity(0)
         if controller:
             await controller.disconnect()
 
@@ -5,27 +5,35 @@ A Pythonic interface for controlling Dynamixel servos with async support.
 Provides high-level abstractions, auto-detection of servo models, and proper error handling.
 """
 
+from .controller import DynamixelController, fan_out
+from .servo import DynamixelServo
 from .constants import AccessType, ControlTableItem, OperatingMode, Baudrate
 from .models import (
     DynamixelModel,
     SUPPORTED_MODELS,
     register_model,
-    XM430W210Model
+    XM430W210Model,
+    Register
 )
 from .exceptions import (
     DynamixelError,
     DynamixelConnectionError,
     DynamixelServoError,
     DynamixelTimeoutError,
-    DynamixelModelError
+    DynamixelModelError,
+    DynamixelTxError
 )
 
 __version__ = "0.1.0"
 __all__ = [
+    'DynamixelController',
+    'fan_out',
+    'DynamixelServo',
     'DynamixelModel',
     'SUPPORTED_MODELS',
     'register_model',
     'XM430W210Model',
+    'Register',
     'OperatingMode',
     'Baudrate',
     'AccessType',
@@ -34,5 +42,6 @@ __all__ = [
     'DynamixelConnectionError',
     'DynamixelServoError',
     'DynamixelTimeoutError',
-    'DynamixelModelError'
+    'DynamixelModelError',
+    'DynamixelTxError'
 ] 
\ No newline at end of file
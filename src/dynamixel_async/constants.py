@@ -2,6 +2,7 @@
 Constants and data structures for Dynamixel servo control.
 """
 
+import sys
 from enum import Enum, IntEnum
 from dataclasses import dataclass
 from typing import Optional, Tuple, Any
@@ -26,6 +27,18 @@ ERROR_DATA_LENGTH = 0x05
 ERROR_DATA_LIMIT = 0x06
 ERROR_ACCESS = 0x07
 
+# Baudrate in bits per second, indexed by Baudrate value
+_BAUD_TO_BPS: Tuple[int, ...] = (
+    9600,
+    57600,
+    115200,
+    1000000,
+    2000000,
+    3000000,
+    4000000,
+    4500000
+)
+
 
 class AccessType(Enum):
     """Access type for control table items."""
@@ -57,19 +70,14 @@ class Baudrate(IntEnum):
     @property
     def value_bps(self) -> int:
         """Get the actual baudrate in bits per second."""
-        return {
-            0: 9600,
-            1: 57600,
-            2: 115200,
-            3: 1000000,
-            4: 2000000,
-            5: 3000000,
-            6: 4000000,
-            7: 4500000
-        }[self.value]
-
-
-@dataclass
+        return _BAUD_TO_BPS[self.value]
+
+
+# Dataclass slots need Python 3.10; older versions fall back to a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ControlTableItem:
     """
     Represents an item in the Dynamixel control table.
@@ -82,6 +90,7 @@ class ControlTableItem:
         value_range: Valid value range (min, max) or specific values
         units: Units of measurement (if applicable)
         default: Default value
+        signed: True if the raw value is a two's complement signed integer
     """
     address: int
     size: int
@@ -89,4 +98,5 @@ class ControlTableItem:
     description: str
     value_range: Optional[Tuple[Any, ...]] = None
     units: Optional[str] = None
-    default: Any = None 
\ No newline at end of file
+    default: Any = None
+    signed: bool = False 
\ No newline at end of file
@@ -2,16 +2,110 @@
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Set
+import concurrent.futures
+import os
+import struct
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import serial.tools.list_ports
 from dynamixel_sdk.port_handler import PortHandler
 from dynamixel_sdk.packet_handler import PacketHandler
+from dynamixel_sdk.group_sync_read import GroupSyncRead
+from dynamixel_sdk.group_sync_write import GroupSyncWrite
+from dynamixel_sdk.robotis_def import COMM_PORT_BUSY, COMM_SUCCESS, COMM_TX_FAIL
 from .servo import DynamixelServo
-from .constants import Baudrate
-from .exceptions import DynamixelConnectionError, DynamixelTimeoutError
+from .models import SUPPORTED_MODELS
+from .transport import PacketTransport, PipelinedPacketHandler
+from .constants import BROADCAST_ID, PROTOCOL_2, ControlTableItem
+from .protocol import Instruction, make_instruction_packet, pack_value, to_signed
+from .exceptions import (
+    DynamixelConnectionError,
+    DynamixelServoError,
+    DynamixelTimeoutError
+)
 
 logger = logging.getLogger(__name__)
 
+# Linux serial driver flag that makes USB-serial adapters (FTDI) flush
+# received data immediately instead of waiting for the latency timer
+ASYNC_LOW_LATENCY = 0x2000
+
+# Offset of the ``flags`` field in ``struct serial_struct`` (<linux/serial.h>)
+_SERIAL_STRUCT_FLAGS_OFFSET = 16
+_SERIAL_STRUCT_SIZE = 128  # Larger than sizeof(struct serial_struct) on all ABIs
+
+def _enable_low_latency(port_handler: PortHandler) -> bool:
+    """
+    Put a USB-serial port into low latency mode.
+    
+    FTDI adapters default to a 16ms latency timer, which delays every
+    status packet. This sets ASYNC_LOW_LATENCY on the port and falls back
+    to writing the sysfs latency timer if the ioctl is not permitted.
+    
+    Args:
+        port_handler: Opened port handler
+        
+    Returns:
+        bool: True if low latency mode was enabled
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+        
+    import fcntl
+    import termios
+    
+    try:
+        fd = port_handler.ser.fileno()
+        buf = bytearray(_SERIAL_STRUCT_SIZE)
+        fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+        flags, = struct.unpack_from("i", buf, _SERIAL_STRUCT_FLAGS_OFFSET)
+        struct.pack_into("i", buf, _SERIAL_STRUCT_FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        logger.debug(f"Enabled ASYNC_LOW_LATENCY on {port_handler.getPortName()}")
+        return True
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not set ASYNC_LOW_LATENCY: {e}")
+        
+    # Fall back to the USB-serial latency timer in sysfs
+    tty = os.path.basename(os.path.realpath(port_handler.getPortName()))
+    latency_path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+    try:
+        with open(latency_path, "w") as f:
+            f.write("1\n")
+        logger.debug(f"Set latency timer to 1ms via {latency_path}")
+        return True
+    except OSError as e:
+        logger.warning(
+            f"Could not enable low latency mode on {port_handler.getPortName()}: {e}"
+        )
+        return False
+
+class LowLatencyPortHandler(PortHandler):
+    """
+    Port handler that waits for each packet to leave the transmit buffer.
+    
+    The SDK starts the status packet timeout right after writing, so bytes
+    still queued in the kernel or USB adapter eat into it and cause spurious
+    timeouts. Draining the output first leaves the whole timeout for the reply.
+    """
+    
+    def writePort(self, packet):
+        written = super().writePort(packet)
+        self.ser.flush()  # tcdrain() on POSIX
+        return written
+
+# USB-serial vendor IDs used by Dynamixel interfaces
+DYNAMIXEL_VIDS = frozenset({
+    0x0403,  # FTDI
+    0x10c4,  # Silicon Labs
+    0x067b,  # Prolific
+})
+
+# Port enumeration walks sysfs, so results are reused briefly across retries
+_PORT_CACHE_TTL = 1.0
+_port_cache: Optional[Tuple[float, Optional[str]]] = None
+
 def find_dynamixel_port() -> Optional[str]:
     """
     Find the most likely port for a Dynamixel controller.
@@ -19,27 +113,65 @@ def find_dynamixel_port() -> Optional[str]:
     Returns:
         str: Port name if found, None otherwise
     """
-    DYNAMIXEL_VENDORS = {
-        "0403",  # FTDI
-        "10c4",  # Silicon Labs
-        "067b",  # Prolific
-    }
-    
-    # First try to find a port with matching vendor ID
-    for port in serial.tools.list_ports.comports():
-        if hasattr(port, 'vid') and port.vid:
-            vid = hex(port.vid)[2:].lower()
-            if vid in DYNAMIXEL_VENDORS:
-                logger.info(f"Found likely Dynamixel controller on {port.device}")
-                return port.device
-    
-    # Fallback to first USB serial port
+    global _port_cache
+    now = time.monotonic()
+    if _port_cache and now - _port_cache[0] < _PORT_CACHE_TTL:
+        return _port_cache[1]
+        
+    # Prefer a matching vendor ID, then fall back to the first USB serial port
+    best_port, best_score = None, 0
     for port in serial.tools.list_ports.comports():
-        if "USB" in port.device:
-            logger.info(f"Using fallback USB port {port.device}")
-            return port.device
+        if port.vid in DYNAMIXEL_VIDS:
+            best_port, best_score = port.device, 2
+            break
+        if best_score == 0 and "USB" in port.device:
+            best_port, best_score = port.device, 1
+            
+    if best_score == 2:
+        logger.info(f"Found likely Dynamixel controller on {best_port}")
+    elif best_score == 1:
+        logger.info(f"Using fallback USB port {best_port}")
+        
+    _port_cache = (now, best_port)
+    return best_port
+
+# Adjacent items read together by read_present_state
+_PRESENT_STATE_ITEMS = (
+    "PRESENT_PWM",
+    "PRESENT_LOAD",
+    "PRESENT_VELOCITY",
+    "PRESENT_POSITION",
+    "PRESENT_INPUT_VOLTAGE",
+    "PRESENT_TEMPERATURE",
+)
+
+# Model methods converting a whole column of raw values at once
+_BATCH_CONVERTERS = {
+    "PRESENT_POSITION": "positions_to_degrees",
+    "PRESENT_VELOCITY": "velocities_to_rpm",
+}
+
+# SDK timing used to pick the cheaper way to scan (see scan_servos)
+_SDK_LATENCY_TIMER = 0.016  # Latency timer allowance in PortHandler timeouts, in seconds
+_PING_STATUS_LENGTH = 14  # Bytes in a Protocol 2.0 ping status packet
+_MAX_ID = 252
+
+def _broadcast_scan_is_faster(id_count: int, baudrate: int) -> bool:
+    """
+    Check whether one broadcast ping beats unicast pings to id_count IDs.
     
-    return None
+    The SDK's broadcastPing always waits out a window sized for replies from
+    every possible ID, while a unicast ping to a missing ID waits out one
+    packet timeout, so both are compared at their worst case.
+    """
+    byte_time = 10.0 / baudrate
+    broadcast_time = _PING_STATUS_LENGTH * _MAX_ID * byte_time + 0.003 * _MAX_ID + 0.016
+    unicast_time = _PING_STATUS_LENGTH * byte_time + 2 * _SDK_LATENCY_TIMER + 0.002
+    return id_count * unicast_time > broadcast_time
+
+# Polling intervals for wait_for_servos, in seconds
+_MIN_POLL_INTERVAL = 0.002
+_MAX_POLL_INTERVAL = 0.05
 
 class DynamixelController:
     """
@@ -61,13 +193,33 @@ class DynamixelController:
         self.port_handler = None
         self.packet_handler = None
         self.servos: Dict[int, DynamixelServo] = {}
+        # Sync read/write handlers keyed by (address, size)
+        self._sync_readers: Dict[Tuple[int, int], GroupSyncRead] = {}
+        self._sync_writers: Dict[Tuple[int, int], GroupSyncWrite] = {}
+        # Parameter buffer for Protocol 2.0 SYNC_WRITE packets, grown as needed
+        self._tx_buf = bytearray(256)
+        # The bus is half-duplex, so all transactions run one at a time on a
+        # single worker thread to keep them off the event loop
+        self._io_lock: Optional[asyncio.Lock] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Event-loop driven transport for single-servo transactions (pipelined mode)
+        self._transport: Optional[PacketTransport] = None
+        self._servo_packet_handler = None
         
-    async def connect(self, scan_ids: Optional[List[int]] = None) -> bool:
+    async def connect(
+        self,
+        scan_ids: Optional[List[int]] = None,
+        minimize_delay: bool = True,
+        pipelined: bool = False
+    ) -> bool:
         """
         Connect to the Dynamixel controller and scan for servos.
         
         Args:
             scan_ids: Optional list of servo IDs to scan. If None, scans common IDs.
+            minimize_delay: Set the return delay time of found servos to 0
+            pipelined: Parse status packets on the event loop instead of
+                blocking a thread per transaction (Protocol 2.0, POSIX only)
             
         Returns:
             bool: True if connection successful
@@ -83,7 +235,7 @@ class DynamixelController:
                 raise DynamixelConnectionError("No suitable port found")
                 
             # Initialize port
-            self.port_handler = PortHandler(self.port)
+            self.port_handler = LowLatencyPortHandler(self.port)
             if not self.port_handler.openPort():
                 raise DynamixelConnectionError(f"Failed to open port {self.port}")
                 
@@ -91,36 +243,105 @@ class DynamixelController:
             if not self.port_handler.setBaudRate(self.baudrate):
                 raise DynamixelConnectionError(f"Failed to set baudrate to {self.baudrate}")
                 
+            # Reduce USB-serial latency for small status packets
+            _enable_low_latency(self.port_handler)
+            
             # Initialize protocol
             self.packet_handler = PacketHandler(self.protocol_version)
-            
+            self._servo_packet_handler = self.packet_handler
+            if pipelined:
+                self._transport = PacketTransport(self.port_handler)
+                self._transport.start()
+                self._servo_packet_handler = PipelinedPacketHandler(
+                    self._transport, self.packet_handler
+                )
+                
             # Scan for servos
             if scan_ids is None:
                 scan_ids = list(range(1, 5))  # Default to scanning IDs 1-4
                 
-            await self.scan_servos(scan_ids)
+            await self.scan_servos(scan_ids, minimize_delay=minimize_delay)
             
             logger.info(f"Successfully connected to {len(self.servos)} servos")
             return True
             
         except Exception as e:
-            raise DynamixelConnectionError(f"Failed to connect: {str(e)}")
+            raise DynamixelConnectionError(f"Failed to connect: {str(e)}") from e
+            
+    async def _txrx(self, fn: Callable, *args: Any) -> Any:
+        """
+        Run a bus transaction, one at a time.
+        
+        Blocking SDK functions run on the I/O thread. In pipelined mode,
+        coroutine functions are awaited directly, and the transport is paused
+        while blocking functions use the port.
+        
+        Args:
+            fn: SDK function (or coroutine function) performing the transaction
+            *args: Arguments for fn
+            
+        Returns:
+            Whatever fn returns
+            
+        Raises:
+            DynamixelConnectionError: If not connected
+        """
+        if not self.port_handler:
+            raise DynamixelConnectionError("Not connected")
+        if self._executor is None:
+            self._io_lock = asyncio.Lock()
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dynamixel-io"
+            )
+        async with self._io_lock:
+            if self._transport is None:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, fn, *args
+                )
+            if asyncio.iscoroutinefunction(fn):
+                return await fn(*args)
+            self._transport.stop()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, fn, *args
+                )
+            finally:
+                self._transport.start()
             
     async def disconnect(self) -> None:
         """Disconnect from the controller and clean up."""
+        if self._transport:
+            self._transport.stop()
+            self._transport = None
+        self._servo_packet_handler = None
         if self.port_handler:
             self.port_handler.closePort()
             self.port_handler = None
         self.packet_handler = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._io_lock = None
         self.servos.clear()
+        self._sync_readers.clear()
+        self._sync_writers.clear()
         logger.info("Disconnected from Dynamixel controller")
         
-    async def scan_servos(self, ids: List[int]) -> Set[int]:
+    async def scan_servos(self, ids: List[int], minimize_delay: bool = False) -> Set[int]:
         """
         Scan for servos with the specified IDs.
         
+        On Protocol 2.0, large ID sets are scanned with a single broadcast
+        ping. The SDK's broadcastPing always waits out a fixed window of
+        14 * 252 byte times + 3ms * 252 + 16ms, about 0.8s at 1 Mbps and
+        1.4s at 57600 baud, however many servos reply. A unicast ping costs
+        at most about 35ms, so smaller sets (fewer than about 24 IDs at
+        1 Mbps or 39 at 57600 baud, including the default IDs 1-4) are
+        pinged one ID at a time.
+        
         Args:
             ids: List of IDs to scan for
+            minimize_delay: Set the return delay time of found servos to 0
             
         Returns:
             Set of found servo IDs
@@ -132,55 +353,368 @@ class DynamixelController:
             raise DynamixelConnectionError("Not connected")
             
         found_ids = set()
-        for servo_id in ids:
-            try:
-                model = await DynamixelServo.detect_model(
+        wanted = set(ids)
+        
+        ping_result, result = None, None
+        if self.protocol_version == PROTOCOL_2 and _broadcast_scan_is_faster(
+            len(wanted), self.baudrate
+        ):
+            ping_result, result = await self._txrx(
+                self.packet_handler.broadcastPing, self.port_handler
+            )
+        if ping_result and result == COMM_SUCCESS:
+            for servo_id, (model_number, _firmware) in ping_result.items():
+                if servo_id not in wanted:
+                    continue
+                model = SUPPORTED_MODELS.get(model_number)
+                if not model:
+                    logger.warning(f"Unknown model number {model_number} at ID {servo_id}")
+                    continue
+                self.servos[servo_id] = DynamixelServo(
                     self.port_handler,
-                    self.packet_handler,
-                    servo_id
+                    self._servo_packet_handler or self.packet_handler,
+                    servo_id,
+                    model,
+                    controller=self
                 )
-                if model:
-                    servo = DynamixelServo(
+                found_ids.add(servo_id)
+                logger.info(f"Found {model.name} at ID {servo_id}")
+        else:
+            # Probe each ID (Protocol 1.0 has no broadcast ping)
+            for servo_id in ids:
+                try:
+                    model = await DynamixelServo.detect_model(
                         self.port_handler,
-                        self.packet_handler,
+                        self._servo_packet_handler or self.packet_handler,
                         servo_id,
-                        model
+                        controller=self
                     )
-                    self.servos[servo_id] = servo
-                    found_ids.add(servo_id)
-                    logger.info(f"Found {model.name} at ID {servo_id}")
-            except Exception as e:
-                logger.debug(f"No servo found at ID {servo_id}: {e}")
+                    if model:
+                        servo = DynamixelServo(
+                            self.port_handler,
+                            self._servo_packet_handler or self.packet_handler,
+                            servo_id,
+                            model,
+                            controller=self
+                        )
+                        self.servos[servo_id] = servo
+                        found_ids.add(servo_id)
+                        logger.info(f"Found {model.name} at ID {servo_id}")
+                except Exception as e:
+                    logger.debug(f"No servo found at ID {servo_id}: {e}")
+                    
+        if minimize_delay:
+            for servo_id in sorted(found_ids):
+                await self._minimize_return_delay(self.servos[servo_id])
                 
         return found_ids
         
+    async def _minimize_return_delay(self, servo: DynamixelServo) -> None:
+        """Set a servo's status packet return delay to 0."""
+        try:
+            delay = await servo._read_from_address("RETURN_DELAY_TIME")
+            if delay == 0:
+                return
+            # EEPROM item, so this fails while torque is enabled
+            await servo._write_to_address("RETURN_DELAY_TIME", 0)
+            logger.info(
+                f"Changed return delay time of servo {servo.id} from {delay * 2}us to 0us"
+            )
+        except Exception as e:
+            logger.warning(f"Could not minimize return delay time of servo {servo.id}: {e}")
+            
     def get_servo(self, servo_id: int) -> Optional[DynamixelServo]:
         """Get a servo by ID if it exists."""
         return self.servos.get(servo_id)
         
+    async def apply_all(
+        self, coro_fn: Callable[[DynamixelServo], Awaitable[Any]]
+    ) -> List[Any]:
+        """
+        Run a coroutine function for every connected servo.
+        
+        Transactions on this bus still run one at a time; use fan_out to
+        overlap work across controllers on separate buses.
+        
+        Args:
+            coro_fn: Coroutine function taking a servo
+            
+        Returns:
+            List[Any]: Results in servo order
+        """
+        return await asyncio.gather(*(coro_fn(servo) for servo in self.servos.values()))
+        
+    def _get_group_item(self, item_name: str, ids: List[int]) -> ControlTableItem:
+        """Look up a control table item shared by all given servos."""
+        if not self.port_handler or not self.packet_handler:
+            raise DynamixelConnectionError("Not connected")
+        item = None
+        for servo_id in ids:
+            servo_item = self.servos[servo_id].model.get_register(item_name)
+            if servo_item is None:
+                raise DynamixelServoError(f"Unknown control table item {item_name}", servo_id)
+            if item and (servo_item.address, servo_item.size) != (item.address, item.size):
+                raise DynamixelServoError(
+                    f"{item_name} is at a different address on this model", servo_id
+                )
+            item = servo_item
+        return item
+        
+    async def _group_read(self, item_name: str, ids: Iterable[int]) -> Dict[int, Any]:
+        """
+        Read the same control table item from several servos with one SYNC_READ.
+        
+        Args:
+            item_name: Control table item name
+            ids: IDs of connected servos to read from
+            
+        Returns:
+            Dict mapping servo ID to the (converted) value
+            
+        Raises:
+            DynamixelServoError: If the sync read fails
+        """
+        values = await self._group_read_items([item_name], ids)
+        return {servo_id: items[item_name] for servo_id, items in values.items()}
+        
+    async def _group_read_items(
+        self, item_names: Sequence[str], ids: Iterable[int], convert: bool = True
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Read several control table items from several servos with one SYNC_READ.
+        
+        A single block spanning all the items is read, so items close together
+        in the control table are cheapest.
+        
+        Args:
+            item_names: Control table item names
+            ids: IDs of connected servos to read from
+            convert: Apply the model's unit converters (otherwise return raw values,
+                with signed items already reinterpreted as signed)
+            
+        Returns:
+            Dict mapping servo ID to a dict of item name to (converted) value
+            
+        Raises:
+            DynamixelServoError: If the sync read fails
+        """
+        ids = list(ids)
+        if not ids:
+            return {}
+        items = [self._get_group_item(name, ids) for name in item_names]
+        start = min(item.address for item in items)
+        length = max(item.address + item.size for item in items) - start
+        
+        key = (start, length)
+        reader = self._sync_readers.get(key)
+        if reader is None:
+            reader = GroupSyncRead(self.port_handler, self.packet_handler, start, length)
+            self._sync_readers[key] = reader
+            
+        def transact() -> Tuple[int, Dict[int, Optional[List[int]]]]:
+            # Readers are shared between ID sets, so poll only the requested servos
+            reader.clearParam()
+            for servo_id in ids:
+                reader.addParam(servo_id)
+            result = reader.txRxPacket()
+            data: Dict[int, Optional[List[int]]] = {}
+            for servo_id in ids:
+                if not reader.isAvailable(servo_id, start, length):
+                    data[servo_id] = None
+                    continue
+                row = []
+                for item in items:
+                    value = reader.getData(servo_id, item.address, item.size)
+                    row.append(to_signed(value, item.size) if item.signed else value)
+                data[servo_id] = row
+            return result, data
+            
+        # Reader state is shared, so parameters and data are handled on the I/O thread
+        result, data = await self._txrx(transact)
+        description = ", ".join(item_names)
+        if result != COMM_SUCCESS:
+            raise DynamixelServoError(
+                f"Failed to sync read {description}: {self.packet_handler.getTxRxResult(result)}"
+            )
+            
+        values = {}
+        for servo_id, raw_values in data.items():
+            if raw_values is None:
+                raise DynamixelServoError(f"No sync read data for {description}", servo_id)
+            if not convert:
+                values[servo_id] = dict(zip(item_names, raw_values))
+                continue
+            model = self.servos[servo_id].model
+            servo_values = {}
+            for name, value in zip(item_names, raw_values):
+                _, from_raw = model.get_value_converters(name)
+                servo_values[name] = from_raw(value) if from_raw else value
+            values[servo_id] = servo_values
+        return values
+        
+    async def read_present_state(self, ids: Optional[Iterable[int]] = None) -> Dict[str, List[Any]]:
+        """
+        Read the present state of several servos with one SYNC_READ.
+        
+        PRESENT_PWM through PRESENT_TEMPERATURE are adjacent, so a single block
+        covers them. Values are returned as columns in the order of ``ids``,
+        ready for ``numpy.asarray`` or a logger, and positions and velocities
+        are converted a column at a time with the model's batch converters.
+        
+        Args:
+            ids: IDs of connected servos to read from (all connected servos if None)
+            
+        Returns:
+            Dict mapping "ID" and each present-state item name to a list of values
+            
+        Raises:
+            DynamixelServoError: If the sync read fails
+        """
+        ids = list(self.servos) if ids is None else list(ids)
+        raw = await self._group_read_items(_PRESENT_STATE_ITEMS, ids, convert=False)
+        
+        models = [self.servos[servo_id].model for servo_id in ids]
+        shared_model = models[0] if models and all(m is models[0] for m in models) else None
+        state: Dict[str, List[Any]] = {"ID": ids}
+        for name in _PRESENT_STATE_ITEMS:
+            column = [raw[servo_id][name] for servo_id in ids]
+            batch = _BATCH_CONVERTERS.get(name)
+            if batch and shared_model:
+                column = list(getattr(shared_model, batch)(column))
+            else:
+                for i, model in enumerate(models):
+                    _, from_raw = model.get_value_converters(name)
+                    if from_raw:
+                        column[i] = from_raw(column[i])
+            state[name] = column
+        return state
+        
+    async def _group_write(self, item_name: str, values: Dict[int, Any]) -> bool:
+        """
+        Write the same control table item on several servos with one SYNC_WRITE.
+        
+        Args:
+            item_name: Control table item name
+            values: Dict mapping servo ID to the (unconverted) value
+            
+        Returns:
+            bool: True if the packet was sent
+            
+        Raises:
+            DynamixelServoError: If a value is invalid or the sync write fails
+        """
+        if not values:
+            return True
+        item = self._get_group_item(item_name, list(values))
+        
+        params = {}
+        for servo_id, value in values.items():
+            servo = self.servos[servo_id]
+            model = servo.model
+            to_raw, _ = model.get_value_converters(item_name)
+            raw = to_raw(value) if to_raw else int(value)
+            if not model.validate_value(item_name, raw):
+                raise servo._out_of_range_error(value, item_name)
+            params[servo_id] = raw
+            
+        if self.protocol_version == PROTOCOL_2:
+            def transact() -> int:
+                return self._send_packet(
+                    self._encode_sync_write(item.address, item.size, params)
+                )
+        else:
+            key = (item.address, item.size)
+            writer = self._sync_writers.get(key)
+            if writer is None:
+                writer = GroupSyncWrite(
+                    self.port_handler, self.packet_handler, item.address, item.size
+                )
+                self._sync_writers[key] = writer
+            mask = (1 << (8 * item.size)) - 1
+            
+            def transact() -> int:
+                for servo_id, raw in params.items():
+                    writer.addParam(servo_id, list((raw & mask).to_bytes(item.size, "little")))
+                try:
+                    return writer.txPacket()
+                finally:
+                    writer.clearParam()
+                    
+        result = await self._txrx(transact)
+        if result != COMM_SUCCESS:
+            raise DynamixelServoError(
+                f"Failed to sync write {item_name}: {self.packet_handler.getTxRxResult(result)}"
+            )
+        return True
+        
+    def _encode_sync_write(self, address: int, size: int, params: Dict[int, int]) -> bytes:
+        """
+        Encode a Protocol 2.0 SYNC_WRITE packet from raw values.
+        
+        Values are packed straight into a reused parameter buffer, so the
+        packet is built without per-byte lists. Only call on the I/O thread.
+        """
+        length = 4 + len(params) * (1 + size)
+        buf = self._tx_buf
+        if len(buf) < length:
+            buf = self._tx_buf = bytearray(length)
+        struct.pack_into("<HH", buf, 0, address, size)
+        offset = 4
+        for servo_id, raw in params.items():
+            buf[offset] = servo_id
+            pack_value(buf, offset + 1, raw, size)
+            offset += 1 + size
+        return make_instruction_packet(BROADCAST_ID, Instruction.SYNC_WRITE, bytes(buf[:length]))
+        
+    def _send_packet(self, packet: bytes) -> int:
+        """Send a packet that gets no status packet back, like the SDK's txPacket."""
+        port = self.port_handler
+        if port.is_using:
+            return COMM_PORT_BUSY
+        port.is_using = True
+        try:
+            port.clearPort()
+            if port.writePort(packet) != len(packet):
+                return COMM_TX_FAIL
+            return COMM_SUCCESS
+        finally:
+            port.is_using = False
+            
     async def set_all_torque(self, enable: bool) -> bool:
         """
         Enable or disable torque on all connected servos.
         
+        Torque is written with one SYNC_WRITE, which servos don't acknowledge,
+        so TORQUE_ENABLE is read back to confirm it.
+        
         Args:
             enable: True to enable, False to disable
             
         Returns:
             bool: True if all servos were successfully set
         """
-        success = True
-        for servo in self.servos.values():
-            try:
-                if enable:
-                    if not servo.enable_torque():
-                        success = False
-                else:
-                    if not servo.disable_torque():
-                        success = False
-            except Exception as e:
-                logger.error(f"Error setting torque on servo {servo.id}: {e}")
-                success = False
-        return success
+        value = 1 if enable else 0
+        try:
+            await self._group_write(
+                "TORQUE_ENABLE", {servo_id: value for servo_id in self.servos}
+            )
+            if self.protocol_version == PROTOCOL_2:
+                states = await self._group_read("TORQUE_ENABLE", self.servos.keys())
+            else:
+                # Protocol 1.0 has no SYNC_READ
+                states = {
+                    servo_id: await servo._read_from_address("TORQUE_ENABLE")
+                    for servo_id, servo in self.servos.items()
+                }
+        except Exception as e:
+            logger.error(f"Error setting torque: {e}")
+            return False
+            
+        failed = sorted(servo_id for servo_id, state in states.items() if bool(state) != enable)
+        if failed:
+            logger.error(f"Torque was not {'enabled' if enable else 'disabled'} on servos {failed}")
+            return False
+        return True
         
     async def wait_for_servos(self, timeout: float = 5.0) -> bool:
         """
@@ -196,26 +730,87 @@ class DynamixelController:
             DynamixelTimeoutError: If timeout occurs
         """
         start_time = asyncio.get_event_loop().time()
+        if self.protocol_version == PROTOCOL_2:
+            estimate = await self._estimate_move_time()
+            tail_polls = 2
+        else:
+            # No sync read to estimate with, so just poll
+            estimate = 0.0
+            tail_polls = 0
+        delay = _MIN_POLL_INTERVAL
         while True:
-            all_stopped = True
-            for servo in self.servos.values():
-                try:
-                    moving = servo._read_from_address("MOVING")
-                    if moving:
-                        all_stopped = False
-                        break
-                except Exception as e:
-                    logger.error(f"Error checking servo {servo.id} movement: {e}")
-                    all_stopped = False
+            try:
+                all_stopped = not await self._any_moving()
+            except Exception as e:
+                logger.error(f"Error checking servo movement: {e}")
+                all_stopped = False
                     
             if all_stopped:
                 return True
                 
-            if asyncio.get_event_loop().time() - start_time > timeout:
+            elapsed = asyncio.get_event_loop().time() - start_time
+            if elapsed > timeout:
                 raise DynamixelTimeoutError("Timeout waiting for servos to stop")
                 
-            await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
+            if tail_polls and elapsed >= estimate:
+                # The move should be finishing, so check again right away
+                tail_polls -= 1
+                await asyncio.sleep(0)
+            else:
+                # Never sleep past the timeout, however long the move is expected to take
+                await asyncio.sleep(min(delay, _MAX_POLL_INTERVAL, max(0.0, timeout - elapsed)))
+                delay = min(delay * 2, _MAX_POLL_INTERVAL)
+                
+    async def _any_moving(self) -> bool:
+        """Check whether any connected servo is moving."""
+        if self.protocol_version == PROTOCOL_2:
+            moving = await self._group_read("MOVING", self.servos.keys())
+            return any(moving.values())
+        # Protocol 1.0 has no SYNC_READ
+        for servo in self.servos.values():
+            if await servo._read_from_address("MOVING"):
+                return True
+        return False
+        
+    async def _estimate_move_time(self) -> float:
+        """Estimate the time in seconds until the slowest servo reaches its goal."""
+        try:
+            states = await self._group_read_items(
+                ["PROFILE_VELOCITY", "GOAL_POSITION", "PRESENT_POSITION"],
+                self.servos.keys()
+            )
+        except Exception as e:
+            logger.debug(f"Could not estimate move time: {e}")
+            return 0.0
             
+        estimate = 0.0
+        for state in states.values():
+            rpm = state["PROFILE_VELOCITY"]
+            if rpm:  # 0 means no profile (maximum velocity)
+                distance = abs(state["GOAL_POSITION"] - state["PRESENT_POSITION"])
+                estimate = max(estimate, distance / (rpm * 6.0))  # 6 deg/s per RPM
+        return estimate
+        
     def get_connected_ids(self) -> List[int]:
         """Get list of connected servo IDs."""
-        return list(self.servos.keys()) 
\ No newline at end of file
+        return list(self.servos.keys()) 
+
+
+async def fan_out(
+    controllers: Sequence[DynamixelController],
+    coro_fn: Callable[[DynamixelServo], Awaitable[Any]]
+) -> List[List[Any]]:
+    """
+    Run a coroutine function for every servo on several controllers concurrently.
+    
+    Each controller drives an independent bus, so work on one overlaps with
+    work on the others.
+    
+    Args:
+        controllers: Controllers to apply coro_fn to
+        coro_fn: Coroutine function taking a servo
+        
+    Returns:
+        List[List[Any]]: Results per controller, in servo order
+    """
+    return await asyncio.gather(*(controller.apply_all(coro_fn) for controller in controllers))
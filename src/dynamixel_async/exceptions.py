@@ -1,6 +1,6 @@
 """Exception classes for Dynamixel-Async library."""
 
-from typing import Optional
+from typing import Any, Optional
 
 
 class DynamixelError(Exception):
@@ -30,10 +30,60 @@ class DynamixelServoError(DynamixelError):
     """Raised when there's an error with a specific servo."""
     
     def __init__(self, message: str, servo_id: Optional[int] = None):
+        self.message = message
         self.servo_id = servo_id
-        super().__init__(
-            f"{message} (servo ID: {servo_id})" if servo_id else message
+        super().__init__(message)
+        
+    def __str__(self) -> str:
+        return f"{self.message} (servo ID: {self.servo_id})" if self.servo_id else self.message
+
+
+class DynamixelTxError(DynamixelServoError):
+    """
+    Raised when a transaction fails or the servo reports an error in its status packet.
+    
+    The message is only formatted when the exception is displayed, so raising
+    it during bus contention stays cheap.
+    
+    Args:
+        result_code: SDK communication result (COMM_*)
+        item_name: Control table item or description of the data accessed
+        servo_id: ID of the servo addressed
+        error: Error byte from the status packet
+        action: "read" or "write"
+        packet_handler: SDK packet handler used to describe result and error codes
+    """
+    
+    def __init__(
+        self,
+        result_code: int,
+        item_name: str,
+        servo_id: Optional[int] = None,
+        error: int = 0,
+        action: str = "access",
+        packet_handler: Any = None
+    ):
+        DynamixelError.__init__(self, result_code, item_name)
+        self.result_code = result_code
+        self.item_name = item_name
+        self.servo_id = servo_id
+        self.error = error
+        self.action = action
+        self.packet_handler = packet_handler
+        
+    @property
+    def message(self) -> str:
+        if self.result_code != 0:  # COMM_SUCCESS
+            reason = (
+                self.packet_handler.getTxRxResult(self.result_code)
+                if self.packet_handler else f"result code {self.result_code}"
+            )
+            return f"Failed to {self.action} {self.item_name}: {reason}"
+        reason = (
+            self.packet_handler.getRxPacketError(self.error)
+            if self.packet_handler else f"error 0x{self.error:02x}"
         )
+        return f"Servo error on {self.action} of {self.item_name}: {reason}"
 
 
 class DynamixelModelError(DynamixelError):
@@ -45,14 +95,18 @@ class DynamixelModelError(DynamixelError):
         model_number: Optional[int] = None,
         servo_id: Optional[int] = None
     ):
+        self.message = message
         self.model_number = model_number
         self.servo_id = servo_id
-        msg = message
-        if model_number:
-            msg = f"{msg} (model: {model_number})"
-        if servo_id:
-            msg = f"{msg} (servo ID: {servo_id})"
-        super().__init__(msg)
+        super().__init__(message)
+        
+    def __str__(self) -> str:
+        msg = self.message
+        if self.model_number:
+            msg = f"{msg} (model: {self.model_number})"
+        if self.servo_id:
+            msg = f"{msg} (servo ID: {self.servo_id})"
+        return msg
 
 
 class DynamixelProtocolError(DynamixelError):
@@ -88,11 +142,15 @@ class DynamixelHardwareError(DynamixelError):
         error_bits: Optional[int] = None,
         servo_id: Optional[int] = None
     ):
+        self.message = message
         self.error_bits = error_bits
         self.servo_id = servo_id
-        msg = message
-        if error_bits is not None:
-            msg = f"{msg} (error bits: 0x{error_bits:02x})"
-        if servo_id is not None:
-            msg = f"{msg} (servo ID: {servo_id})"
-        super().__init__(msg) 
\ No newline at end of file
+        super().__init__(message)
+        
+    def __str__(self) -> str:
+        msg = self.message
+        if self.error_bits is not None:
+            msg = f"{msg} (error bits: 0x{self.error_bits:02x})"
+        if self.servo_id is not None:
+            msg = f"{msg} (servo ID: {self.servo_id})"
+        return msg 
\ No newline at end of file
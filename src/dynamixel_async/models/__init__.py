@@ -3,7 +3,7 @@ Dynamixel servo model definitions.
 """
 
 from .base import DynamixelModel, SUPPORTED_MODELS, register_model
-from .xm430 import XM430W210Model
+from .xm430 import XM430W210Model, Register
 
 # Register supported models
 register_model(XM430W210Model)
@@ -12,5 +12,6 @@ __all__ = [
     'DynamixelModel',
     'SUPPORTED_MODELS',
     'register_model',
-    'XM430W210Model'
+    'XM430W210Model',
+    'Register'
 ] 
\ No newline at end of file
@@ -2,34 +2,149 @@
 Base class for Dynamixel servo models.
 """
 
-from typing import Dict, Set, Optional, Any
-from ..constants import ControlTableItem, AccessType
+import sys
+from array import array
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Any, Tuple, Type, Union
+from ..constants import ControlTableItem, AccessType, OperatingMode
+from ..protocol import to_signed
+
+# Model feature required for each operating mode
+MODE_FEATURES: Dict[OperatingMode, str] = {
+    OperatingMode.CURRENT: "current_control",
+    OperatingMode.VELOCITY: "velocity_control",
+    OperatingMode.POSITION: "position_control",
+    OperatingMode.EXTENDED_POSITION: "extended_position",
+    OperatingMode.CURRENT_BASED_POSITION: "current_based_position",
+    OperatingMode.PWM: "pwm_control",
+}
+
+
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+def _make_validator(value_range: Optional[Tuple[Any, ...]]) -> Callable[[Any], bool]:
+    """Build a validator for a register's value range, deciding its kind once."""
+    if value_range is None:
+        return _accept_any
+    if len(value_range) == 1:
+        # Single valid value
+        valid_value = value_range[0]
+        return lambda value: value == valid_value
+    if len(value_range) == 2:
+        # Range of values
+        min_val, max_val = value_range
+        return lambda value: min_val <= value <= max_val
+    # List of valid values
+    valid_values = tuple(value_range)
+    return lambda value: value in valid_values
 
 
 class DynamixelModel:
     """Base class for all Dynamixel servo models."""
     
     MODEL_NUMBER: int = None
+    NAME: str = None
     PROTOCOL_VERSION: float = 2.0
     
+    # Register token enum valued by control table index (None if the model has none)
+    REGISTERS: Optional[Type[IntEnum]] = None
+    
     def __init__(self):
         """Initialize the model."""
         if self.MODEL_NUMBER is None:
             raise NotImplementedError("MODEL_NUMBER must be defined in subclass")
             
-        self.control_table: Dict[str, ControlTableItem] = {}
-        self.features: Set[str] = set()
+        self.model_number: int = self.MODEL_NUMBER
+        self.name: str = self.NAME or type(self).__name__
+        self.control_table = {}
+        self.features = set()
+        
+    @property
+    def features(self) -> FrozenSet[str]:
+        return self._features
+        
+    @features.setter
+    def features(self, features: Iterable[str]) -> None:
+        """
+        Set the supported features and derive the operating mode bitmask.
+        
+        Bit ``mode`` of ``feature_mask`` is set when the feature needed by that
+        OperatingMode is supported, so mode checks are a single AND. Features are
+        stored as a frozenset so the mask can't go stale; assign a new collection
+        to change them.
+        """
+        features = frozenset(features)
+        self._features = features
+        self.feature_mask = 0
+        for mode, feature in MODE_FEATURES.items():
+            if feature in features:
+                self.feature_mask |= 1 << mode
+                
+    @property
+    def control_table(self) -> Mapping[str, ControlTableItem]:
+        return self._control_table
+        
+    @control_table.setter
+    def control_table(self, control_table: Mapping[str, ControlTableItem]) -> None:
+        """
+        Set the control table and index it as parallel arrays.
+        
+        ``_name_to_idx`` maps each (interned) register name to its position in
+        ``_addr``, ``_size``, ``_writable`` and ``_validators``, so looking up a field
+        is one hash probe plus an integer index. Members of the model's REGISTERS
+        enum are valued by that position, so they can be used as register tokens
+        that skip the name lookup. The table is copied into a read-only mapping so
+        the index can't go stale; assign a new table to change it.
+        """
+        control_table = MappingProxyType(dict(control_table))
+        self._control_table = control_table
+        self._names: Tuple[str, ...] = tuple(sys.intern(name) for name in control_table)
+        self._name_to_idx: Dict[str, int] = {name: idx for idx, name in enumerate(self._names)}
+        items = list(control_table.values())
+        self._addr = array("H", (item.address for item in items))
+        self._size = array("B", (item.size for item in items))
+        self._writable = array("B", (item.access == AccessType.READ_WRITE for item in items))
+        self._validators: Tuple[Callable[[Any], bool], ...] = tuple(
+            _make_validator(item.value_range) for item in items
+        )
         
-    def get_register(self, name: str) -> Optional[ControlTableItem]:
-        """Get a control table register by name."""
-        return self.control_table.get(name)
+    def get_register(self, name: Union[str, int]) -> Optional[ControlTableItem]:
+        """Get a control table register by name or register token."""
+        if isinstance(name, int):
+            if type(name) is not self.REGISTERS:
+                return None
+            name = self._names[name]
+        return self._control_table.get(name)
         
-    def validate_value(self, register_name: str, value: Any) -> bool:
+    def register_name(self, register: Union[str, int]) -> str:
+        """
+        Get the name of a register given its name or register token.
+        
+        Raises:
+            KeyError: If the register doesn't exist
+        """
+        return self._names[self._register_index(register)]
+        
+    def _register_index(self, register_name: Union[str, int]) -> int:
+        if isinstance(register_name, int):
+            # Only this model's own tokens; another model's index means another register
+            if type(register_name) is not self.REGISTERS:
+                raise KeyError(f"Register {register_name!r} is not a {self.NAME} register token")
+            return register_name
+        idx = self._name_to_idx.get(register_name)
+        if idx is None:
+            raise KeyError(f"Register {register_name} not found")
+        return idx
+        
+    def validate_value(self, register_name: Union[str, int], value: Any) -> bool:
         """
         Validate a value for a given register.
         
         Args:
-            register_name: Name of the register
+            register_name: Name or register token of the register
             value: Value to validate
             
         Returns:
@@ -39,23 +154,63 @@ class DynamixelModel:
             KeyError: If register_name doesn't exist
             ValueError: If value is invalid for the register
         """
+        return self._validators[self._register_index(register_name)](value)
+        
+    def get_validator(self, register_name: Union[str, int]) -> Callable[[Any], bool]:
+        """
+        Get the precomputed validator for a register.
+        
+        Args:
+            register_name: Name or register token of the register
+            
+        Returns:
+            Callable taking a raw value and returning True if it is valid
+            
+        Raises:
+            KeyError: If register_name doesn't exist
+        """
+        return self._validators[self._register_index(register_name)]
+        
+    def get_value_converters(
+        self, register_name: str
+    ) -> Tuple[Optional[Callable[[Any], int]], Optional[Callable[[int], Any]]]:
+        """
+        Get unit converters for a register.
+        
+        Args:
+            register_name: Name of the register
+            
+        Returns:
+            Tuple of (to_raw, from_raw) callables, None where no conversion applies.
+            For signed registers, from_raw also reinterprets the unsigned value
+            returned by the SDK as signed.
+            
+        Raises:
+            KeyError: If register_name doesn't exist
+        """
         register = self.get_register(register_name)
         if not register:
             raise KeyError(f"Register {register_name} not found")
             
-        if register.value_range is None:
-            return True
-            
-        if len(register.value_range) == 1:
-            # Single valid value
-            return value == register.value_range[0]
-        elif len(register.value_range) == 2:
-            # Range of values
-            min_val, max_val = register.value_range
-            return min_val <= value <= max_val
+        to_raw: Optional[Callable[[Any], int]]
+        from_raw: Optional[Callable[[int], Any]]
+        if register.units == "pulse":
+            to_raw, from_raw = self.degrees_to_position, self.position_to_degrees
+        elif register.units == "0.229 rev/min":
+            to_raw, from_raw = self.rpm_to_velocity, self.velocity_to_rpm
+        elif register.units == "2.69 mA":
+            to_raw, from_raw = self.ma_to_current, self.current_to_ma
+        else:
+            to_raw, from_raw = None, None
             
-        # List of valid values
-        return value in register.value_range
+        if not register.signed:
+            return to_raw, from_raw
+        size, convert = register.size, from_raw
+        
+        def signed_from_raw(value: int) -> Any:
+            value = to_signed(value, size)
+            return convert(value) if convert else value
+        return to_raw, signed_from_raw
         
     def has_feature(self, feature: str) -> bool:
         """Check if model supports a specific feature."""
@@ -77,12 +232,28 @@ class DynamixelModel:
         """Convert RPM to raw velocity value."""
         raise NotImplementedError
         
-    def validate_register_access(self, register_name: str, is_write: bool = False) -> bool:
+    def current_to_ma(self, current: int) -> float:
+        """Convert raw current value to mA."""
+        raise NotImplementedError
+        
+    def ma_to_current(self, ma: float) -> int:
+        """Convert mA to raw current value."""
+        raise NotImplementedError
+        
+    def positions_to_degrees(self, positions: Iterable[int]) -> Any:
+        """Convert many raw position values to degrees."""
+        return [self.position_to_degrees(position) for position in positions]
+        
+    def velocities_to_rpm(self, velocities: Iterable[int]) -> Any:
+        """Convert many raw velocity values to RPM."""
+        return [self.velocity_to_rpm(velocity) for velocity in velocities]
+        
+    def validate_register_access(self, register_name: Union[str, int], is_write: bool = False) -> bool:
         """
         Validate if a register can be accessed in the specified mode.
         
         Args:
-            register_name: Name of the register
+            register_name: Name or register token of the register
             is_write: True if write access is required, False for read
             
         Returns:
@@ -91,12 +262,9 @@ class DynamixelModel:
         Raises:
             KeyError: If register_name doesn't exist
         """
-        register = self.get_register(register_name)
-        if not register:
-            raise KeyError(f"Register {register_name} not found")
-            
+        idx = self._register_index(register_name)
         if is_write:
-            return register.access == AccessType.READ_WRITE
+            return bool(self._writable[idx])
         return True  # All registers are readable
 
 
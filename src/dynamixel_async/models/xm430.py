@@ -3,362 +3,395 @@ Control table definitions for XM430-W210/W350 DYNAMIXEL servos.
 Reference: https://emanual.robotis.com/docs/en/dxl/x/xm430-w210/
 """
 
+import sys
+from enum import IntEnum
+from typing import Any, Tuple
 from ..constants import ControlTableItem, AccessType, PROTOCOL_2
 from .base import DynamixelModel
 
-# EEPROM Area (Persisted even after power cycle)
-EEPROM_REGISTERS = {
-    "MODEL_NUMBER": ControlTableItem(
+# Unit conversion factors
+_DEG_PER_PULSE = 360.0 / 4096.0
+_PULSE_PER_DEG = 4096.0 / 360.0
+_RPM_PER_UNIT = 0.229
+_MA_PER_UNIT = 2.69
+
+# Registers in address order
+_REGISTERS: Tuple[Tuple[str, ControlTableItem], ...] = (
+    # EEPROM Area (Persisted even after power cycle)
+    ("MODEL_NUMBER", ControlTableItem(
         0, 2, AccessType.READ_ONLY,
         "Model Number",
         value_range=(1030,),  # XM430-W210 model number
         units=None,
         default=1030
-    ),
-    "MODEL_INFORMATION": ControlTableItem(
+    )),
+    ("MODEL_INFORMATION", ControlTableItem(
         2, 4, AccessType.READ_ONLY,
         "Model Information",
         value_range=None,
         units=None,
         default=None
-    ),
-    "FIRMWARE_VERSION": ControlTableItem(
+    )),
+    ("FIRMWARE_VERSION", ControlTableItem(
         6, 1, AccessType.READ_ONLY,
         "Firmware Version",
         value_range=None,
         units=None,
         default=None
-    ),
-    "ID": ControlTableItem(
+    )),
+    ("ID", ControlTableItem(
         7, 1, AccessType.READ_WRITE,
         "DYNAMIXEL ID",
         value_range=(0, 252),
         units=None,
         default=1
-    ),
-    "BAUD_RATE": ControlTableItem(
+    )),
+    ("BAUD_RATE", ControlTableItem(
         8, 1, AccessType.READ_WRITE,
         "Communication Speed",
         value_range=(0, 7),
         units="bps",
         default=1  # 57600 bps
-    ),
-    "RETURN_DELAY_TIME": ControlTableItem(
+    )),
+    ("RETURN_DELAY_TIME", ControlTableItem(
         9, 1, AccessType.READ_WRITE,
         "Response Delay Time",
         value_range=(0, 254),
         units="2 usec",
         default=250  # 500us
-    ),
-    "DRIVE_MODE": ControlTableItem(
+    )),
+    ("DRIVE_MODE", ControlTableItem(
         10, 1, AccessType.READ_WRITE,
         "Drive Mode",
         value_range=(0, 5),
         units=None,
         default=0
-    ),
-    "OPERATING_MODE": ControlTableItem(
+    )),
+    ("OPERATING_MODE", ControlTableItem(
         11, 1, AccessType.READ_WRITE,
         "Operating Mode",
         value_range=(0, 16),
         units=None,
         default=3  # Position Control Mode
-    ),
-    "SECONDARY_ID": ControlTableItem(
+    )),
+    ("SECONDARY_ID", ControlTableItem(
         12, 1, AccessType.READ_WRITE,
         "Secondary ID",
         value_range=(0, 252),
         units=None,
         default=255
-    ),
-    "PROTOCOL_VERSION": ControlTableItem(
+    )),
+    ("PROTOCOL_VERSION", ControlTableItem(
         13, 1, AccessType.READ_WRITE,
         "Protocol Version",
         value_range=(1, 2),
         units=None,
         default=2
-    ),
-    "HOMING_OFFSET": ControlTableItem(
+    )),
+    ("HOMING_OFFSET", ControlTableItem(
         20, 4, AccessType.READ_WRITE,
         "Home Position Offset",
         value_range=(-1044479, 1044479),
         units="pulse",
-        default=0
-    ),
-    "MOVING_THRESHOLD": ControlTableItem(
+        default=0,
+        signed=True
+    )),
+    ("MOVING_THRESHOLD", ControlTableItem(
         24, 4, AccessType.READ_WRITE,
         "Velocity Threshold for Movement Detection",
         value_range=(0, 1023),
         units="0.229 rev/min",
         default=10
-    ),
-    "TEMPERATURE_LIMIT": ControlTableItem(
+    )),
+    ("TEMPERATURE_LIMIT", ControlTableItem(
         31, 1, AccessType.READ_WRITE,
         "Maximum Internal Temperature Limit",
         value_range=(0, 100),
         units="°C",
         default=80
-    ),
-    "MAX_VOLTAGE_LIMIT": ControlTableItem(
+    )),
+    ("MAX_VOLTAGE_LIMIT", ControlTableItem(
         32, 2, AccessType.READ_WRITE,
         "Maximum Input Voltage Limit",
         value_range=(95, 160),
         units="0.1V",
         default=160
-    ),
-    "MIN_VOLTAGE_LIMIT": ControlTableItem(
+    )),
+    ("MIN_VOLTAGE_LIMIT", ControlTableItem(
         34, 2, AccessType.READ_WRITE,
         "Minimum Input Voltage Limit",
         value_range=(95, 160),
         units="0.1V",
         default=95
-    ),
-    "PWM_LIMIT": ControlTableItem(
+    )),
+    ("PWM_LIMIT", ControlTableItem(
         36, 2, AccessType.READ_WRITE,
         "Maximum PWM Limit",
         value_range=(0, 885),
         units=None,
         default=885
-    ),
-    "VELOCITY_LIMIT": ControlTableItem(
+    )),
+    ("CURRENT_LIMIT", ControlTableItem(
+        38, 2, AccessType.READ_WRITE,
+        "Maximum Current Limit",
+        value_range=(0, 1193),
+        units="2.69 mA",
+        default=1193
+    )),
+    ("VELOCITY_LIMIT", ControlTableItem(
         44, 4, AccessType.READ_WRITE,
         "Maximum Velocity Limit",
         value_range=(0, 1023),
         units="0.229 rev/min",
         default=1023
-    ),
-    "MAX_POSITION_LIMIT": ControlTableItem(
+    )),
+    ("MAX_POSITION_LIMIT", ControlTableItem(
         48, 4, AccessType.READ_WRITE,
         "Maximum Position Limit",
         value_range=(0, 4095),
         units="pulse",
         default=4095
-    ),
-    "MIN_POSITION_LIMIT": ControlTableItem(
+    )),
+    ("MIN_POSITION_LIMIT", ControlTableItem(
         52, 4, AccessType.READ_WRITE,
         "Minimum Position Limit",
         value_range=(0, 4095),
         units="pulse",
         default=0
-    ),
-    "SHUTDOWN": ControlTableItem(
+    )),
+    ("SHUTDOWN", ControlTableItem(
         63, 1, AccessType.READ_WRITE,
         "Shutdown Error Information",
         value_range=(0, 127),
         units=None,
         default=52
-    ),
-}
-
-# RAM Area (Reset after power cycle)
-RAM_REGISTERS = {
-    "TORQUE_ENABLE": ControlTableItem(
+    )),
+    
+    # RAM Area (Reset after power cycle)
+    ("TORQUE_ENABLE", ControlTableItem(
         64, 1, AccessType.READ_WRITE,
         "Motor Torque On/Off",
         value_range=(0, 1),
         units=None,
         default=0
-    ),
-    "LED": ControlTableItem(
+    )),
+    ("LED", ControlTableItem(
         65, 1, AccessType.READ_WRITE,
         "Status LED On/Off",
         value_range=(0, 1),
         units=None,
         default=0
-    ),
-    "STATUS_RETURN_LEVEL": ControlTableItem(
+    )),
+    ("STATUS_RETURN_LEVEL", ControlTableItem(
         68, 1, AccessType.READ_WRITE,
         "Status Return Level",
         value_range=(0, 2),
         units=None,
         default=2
-    ),
-    "REGISTERED_INSTRUCTION": ControlTableItem(
+    )),
+    ("REGISTERED_INSTRUCTION", ControlTableItem(
         69, 1, AccessType.READ_ONLY,
         "Registered Instruction Status",
         value_range=(0, 1),
         units=None,
         default=0
-    ),
-    "HARDWARE_ERROR_STATUS": ControlTableItem(
+    )),
+    ("HARDWARE_ERROR_STATUS", ControlTableItem(
         70, 1, AccessType.READ_ONLY,
         "Hardware Error Status",
         value_range=None,
         units=None,
         default=0
-    ),
-    "VELOCITY_I_GAIN": ControlTableItem(
+    )),
+    ("VELOCITY_I_GAIN", ControlTableItem(
         76, 2, AccessType.READ_WRITE,
         "Velocity I Gain",
         value_range=(0, 16383),
         units=None,
         default=1000
-    ),
-    "VELOCITY_P_GAIN": ControlTableItem(
+    )),
+    ("VELOCITY_P_GAIN", ControlTableItem(
         78, 2, AccessType.READ_WRITE,
         "Velocity P Gain",
         value_range=(0, 16383),
         units=None,
         default=100
-    ),
-    "POSITION_D_GAIN": ControlTableItem(
+    )),
+    ("POSITION_D_GAIN", ControlTableItem(
         80, 2, AccessType.READ_WRITE,
         "Position D Gain",
         value_range=(0, 16383),
         units=None,
         default=2000
-    ),
-    "POSITION_I_GAIN": ControlTableItem(
+    )),
+    ("POSITION_I_GAIN", ControlTableItem(
         82, 2, AccessType.READ_WRITE,
         "Position I Gain",
         value_range=(0, 16383),
         units=None,
         default=0
-    ),
-    "POSITION_P_GAIN": ControlTableItem(
+    )),
+    ("POSITION_P_GAIN", ControlTableItem(
         84, 2, AccessType.READ_WRITE,
         "Position P Gain",
         value_range=(0, 16383),
         units=None,
         default=640
-    ),
-    "FEEDFORWARD_2ND_GAIN": ControlTableItem(
+    )),
+    ("FEEDFORWARD_2ND_GAIN", ControlTableItem(
         88, 2, AccessType.READ_WRITE,
         "Feedforward 2nd Gain",
         value_range=(0, 16383),
         units=None,
         default=0
-    ),
-    "FEEDFORWARD_1ST_GAIN": ControlTableItem(
+    )),
+    ("FEEDFORWARD_1ST_GAIN", ControlTableItem(
         90, 2, AccessType.READ_WRITE,
         "Feedforward 1st Gain",
         value_range=(0, 16383),
         units=None,
         default=0
-    ),
-    "BUS_WATCHDOG": ControlTableItem(
+    )),
+    ("BUS_WATCHDOG", ControlTableItem(
         98, 1, AccessType.READ_WRITE,
         "Bus Watchdog",
         value_range=(1, 127),
         units="20 msec",
         default=0
-    ),
-    "GOAL_PWM": ControlTableItem(
+    )),
+    ("GOAL_PWM", ControlTableItem(
         100, 2, AccessType.READ_WRITE,
         "Target PWM Value",
-        value_range=(-PWM_LIMIT, PWM_LIMIT),
+        value_range=(-885, 885),  # PWM_LIMIT default
         units=None,
-        default=0
-    ),
-    "GOAL_VELOCITY": ControlTableItem(
+        default=0,
+        signed=True
+    )),
+    ("GOAL_VELOCITY", ControlTableItem(
         104, 4, AccessType.READ_WRITE,
         "Target Velocity Value",
-        value_range=(-VELOCITY_LIMIT, VELOCITY_LIMIT),
+        value_range=(-1023, 1023),  # VELOCITY_LIMIT default
         units="0.229 rev/min",
-        default=0
-    ),
-    "PROFILE_ACCELERATION": ControlTableItem(
+        default=0,
+        signed=True
+    )),
+    ("PROFILE_ACCELERATION", ControlTableItem(
         108, 4, AccessType.READ_WRITE,
         "Acceleration Value of Profile",
         value_range=(0, 32767),
         units="214.577 rev/min²",
         default=0
-    ),
-    "PROFILE_VELOCITY": ControlTableItem(
+    )),
+    ("PROFILE_VELOCITY", ControlTableItem(
         112, 4, AccessType.READ_WRITE,
         "Velocity Value of Profile",
         value_range=(0, 32767),
         units="0.229 rev/min",
         default=0
-    ),
-    "GOAL_POSITION": ControlTableItem(
+    )),
+    ("GOAL_POSITION", ControlTableItem(
         116, 4, AccessType.READ_WRITE,
         "Target Position Value",
-        value_range=(MIN_POSITION_LIMIT, MAX_POSITION_LIMIT),
+        value_range=(0, 4095),  # MIN/MAX_POSITION_LIMIT defaults
         units="pulse",
-        default=None
-    ),
-    "REALTIME_TICK": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("REALTIME_TICK", ControlTableItem(
         120, 2, AccessType.READ_ONLY,
         "Real Time Clock",
         value_range=(0, 32767),
         units="1 msec",
         default=None
-    ),
-    "MOVING": ControlTableItem(
+    )),
+    ("MOVING", ControlTableItem(
         122, 1, AccessType.READ_ONLY,
         "Movement Status",
         value_range=(0, 1),
         units=None,
         default=0
-    ),
-    "MOVING_STATUS": ControlTableItem(
+    )),
+    ("MOVING_STATUS", ControlTableItem(
         123, 1, AccessType.READ_ONLY,
         "Detailed Movement Status",
         value_range=(0, 255),
         units=None,
         default=0
-    ),
-    "PRESENT_PWM": ControlTableItem(
+    )),
+    ("PRESENT_PWM", ControlTableItem(
         124, 2, AccessType.READ_ONLY,
         "Present PWM Value",
         value_range=None,
         units=None,
-        default=None
-    ),
-    "PRESENT_LOAD": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("PRESENT_LOAD", ControlTableItem(
         126, 2, AccessType.READ_ONLY,
         "Present Load Value",
         value_range=None,
         units="%",
-        default=None
-    ),
-    "PRESENT_VELOCITY": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("PRESENT_VELOCITY", ControlTableItem(
         128, 4, AccessType.READ_ONLY,
         "Present Velocity Value",
         value_range=None,
         units="0.229 rev/min",
-        default=None
-    ),
-    "PRESENT_POSITION": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("PRESENT_POSITION", ControlTableItem(
         132, 4, AccessType.READ_ONLY,
         "Present Position Value",
         value_range=None,
         units="pulse",
-        default=None
-    ),
-    "VELOCITY_TRAJECTORY": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("VELOCITY_TRAJECTORY", ControlTableItem(
         136, 4, AccessType.READ_ONLY,
         "Velocity Profile Value",
         value_range=None,
         units="0.229 rev/min",
-        default=None
-    ),
-    "POSITION_TRAJECTORY": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("POSITION_TRAJECTORY", ControlTableItem(
         140, 4, AccessType.READ_ONLY,
         "Position Profile Value",
         value_range=None,
         units="pulse",
-        default=None
-    ),
-    "PRESENT_INPUT_VOLTAGE": ControlTableItem(
+        default=None,
+        signed=True
+    )),
+    ("PRESENT_INPUT_VOLTAGE", ControlTableItem(
         144, 2, AccessType.READ_ONLY,
         "Present Input Voltage",
         value_range=None,
         units="0.1V",
         default=None
-    ),
-    "PRESENT_TEMPERATURE": ControlTableItem(
+    )),
+    ("PRESENT_TEMPERATURE", ControlTableItem(
         146, 1, AccessType.READ_ONLY,
         "Present Internal Temperature",
         value_range=None,
         units="°C",
         default=None
-    ),
-}
+    )),
+)
+
+# EEPROM items are persisted, RAM items reset after power cycle
+_RAM_START = 64
+
+CONTROL_TABLE = {sys.intern(name): item for name, item in _REGISTERS}
+EEPROM_REGISTERS = {name: item for name, item in _REGISTERS if item.address < _RAM_START}
+RAM_REGISTERS = {name: item for name, item in _REGISTERS if item.address >= _RAM_START}
 
-# Combine all registers
-CONTROL_TABLE = {**EEPROM_REGISTERS, **RAM_REGISTERS}
+# Register tokens, valued by each register's index in the model's control table
+# arrays, so servos and models can look them up without hashing the name
+Register = IntEnum("Register", [(name, idx) for idx, name in enumerate(CONTROL_TABLE)])
 
 class XM430W210Model(DynamixelModel):
     """
@@ -379,7 +412,9 @@ class XM430W210Model(DynamixelModel):
     """
     
     MODEL_NUMBER = 1030
+    NAME = "XM430-W210"
     PROTOCOL_VERSION = PROTOCOL_2
+    REGISTERS = Register
     
     def __init__(self):
         super().__init__()
@@ -402,7 +437,7 @@ class XM430W210Model(DynamixelModel):
         Returns:
             float: Position in degrees (0-360)
         """
-        return (position * 360.0) / 4096.0
+        return position * _DEG_PER_PULSE
         
     def degrees_to_position(self, degrees: float) -> int:
         """
@@ -414,23 +449,19 @@ class XM430W210Model(DynamixelModel):
         Returns:
             int: Raw position value (0-4095)
         """
-        return int((degrees * 4096.0) / 360.0)
+        return int(degrees * _PULSE_PER_DEG)
         
     def velocity_to_rpm(self, velocity: int) -> float:
         """
         Convert velocity value to RPM.
         
         Args:
-            velocity: Raw velocity value
+            velocity: Raw velocity value, signed (negative is clockwise)
             
         Returns:
             float: Velocity in RPM
-            
-        Note:
-            Velocity of 0 represents maximum RPM in CCW direction
-            Velocity of 1023 represents maximum RPM in CW direction
         """
-        return velocity * 0.229
+        return velocity * _RPM_PER_UNIT
         
     def rpm_to_velocity(self, rpm: float) -> int:
         """
@@ -446,4 +477,58 @@ class XM430W210Model(DynamixelModel):
             Maximum RPM depends on operating voltage
             41 RPM at 12V
         """
-        return int(rpm / 0.229) 
\ No newline at end of file
+        # Divide rather than multiply by the reciprocal, which truncates exact
+        # multiples of 0.229 rpm down by one unit
+        return int(rpm / _RPM_PER_UNIT)
+        
+    def current_to_ma(self, current: int) -> float:
+        """
+        Convert current value to mA.
+        
+        Args:
+            current: Raw current value
+            
+        Returns:
+            float: Current in mA
+        """
+        return current * _MA_PER_UNIT
+        
+    def ma_to_current(self, ma: float) -> int:
+        """
+        Convert mA to current value.
+        
+        Args:
+            ma: Current in mA
+            
+        Returns:
+            int: Raw current value
+        """
+        return int(ma / _MA_PER_UNIT)
+        
+    def positions_to_degrees(self, positions: Any) -> Any:
+        """
+        Convert many raw position values to degrees.
+        
+        Args:
+            positions: List or tuple of raw position values, or a NumPy array
+            
+        Returns:
+            List of degrees for list or tuple input, otherwise an array
+        """
+        if isinstance(positions, (list, tuple)):
+            return [position * _DEG_PER_PULSE for position in positions]
+        return positions * _DEG_PER_PULSE
+            
+    def velocities_to_rpm(self, velocities: Any) -> Any:
+        """
+        Convert many raw velocity values to RPM.
+        
+        Args:
+            velocities: List or tuple of raw velocity values, or a NumPy array
+            
+        Returns:
+            List of RPM values for list or tuple input, otherwise an array
+        """
+        if isinstance(velocities, (list, tuple)):
+            return [velocity * _RPM_PER_UNIT for velocity in velocities]
+        return velocities * _RPM_PER_UNIT
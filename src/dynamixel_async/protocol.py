@@ -1,6 +1,9 @@
 """Protocol definitions for Dynamixel communication."""
 
+import functools
+import struct
 from enum import IntEnum
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple
 
 
 class Instruction(IntEnum):
@@ -41,18 +44,44 @@ HEADER = [0xFF, 0xFF, 0xFD]
 RESERVED = 0x00
 MAX_PACKET_LENGTH = 256
 MIN_PACKET_LENGTH = 10  # Header(3) + Reserved(1) + ID(1) + Length(2) + Instruction(1) + CRC(2)
+STATUS_PACKET_LENGTH = 11  # MIN_PACKET_LENGTH + Error(1), without parameters
+
+CRC_POLYNOMIAL = 0x8005  # CRC-16/BUYPASS
+
+
+def _make_crc_table() -> Tuple[int, ...]:
+    """Build the 256-entry lookup table for CRC_POLYNOMIAL."""
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ CRC_POLYNOMIAL) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
 
 # CRC lookup table for Protocol 2.0
-CRC_TABLE = [
-    0x0000, 0x8005, 0x800F, 0x000A, 0x801B, 0x001E, 0x0014, 0x8011,
-    0x8033, 0x0036, 0x003C, 0x8039, 0x0028, 0x802D, 0x8027, 0x0022,
-    0x8063, 0x0066, 0x006C, 0x8069, 0x0078, 0x807D, 0x8077, 0x0072,
-    0x0050, 0x8055, 0x805F, 0x005A, 0x804B, 0x004E, 0x0044, 0x8041,
-    0x80C3, 0x00C6, 0x00CC, 0x80C9, 0x00D8, 0x80DD, 0x80D7, 0x00D2,
-    0x00F0, 0x80F5, 0x80FF, 0x00FA, 0x80EB, 0x00EE, 0x00E4, 0x80E1,
-    0x00A0, 0x80A5, 0x80AF, 0x00AA, 0x80BB, 0x00BE, 0x00B4, 0x80B1,
-    0x8093, 0x0096, 0x009C, 0x8099, 0x0088, 0x808D, 0x8087, 0x0082,
-]
+CRC_TABLE = _make_crc_table()
+
+# Blocks at least this long are processed two bytes at a time
+_CRC_WIDE_MIN_LENGTH = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _wide_crc_table() -> Tuple[int, ...]:
+    """
+    Build the 65536-entry table that advances the CRC by two bytes.
+    
+    Entry ``x`` is the CRC after feeding the two bytes of ``x`` (big-endian)
+    to a zero accumulator, so ``table[crc ^ word]`` advances ``crc`` by ``word``.
+    Built on first use since it takes a few milliseconds and about 2 MB.
+    """
+    table = CRC_TABLE
+    wide = []
+    for x in range(65536):
+        crc = ((x << 8) ^ table[x >> 8]) & 0xFFFF
+        wide.append(((crc << 8) ^ table[crc >> 8]) & 0xFFFF)
+    return tuple(wide)
 
 
 def update_crc(crc_accum: int, data_blk: bytes) -> int:
@@ -66,10 +95,154 @@ def update_crc(crc_accum: int, data_blk: bytes) -> int:
     Returns:
         int: Updated CRC value
     """
+    table = CRC_TABLE
+    crc = crc_accum
+    length = len(data_blk)
+    if length >= _CRC_WIDE_MIN_LENGTH:
+        wide = _wide_crc_table()
+        even = length & ~1
+        for (word,) in struct.iter_unpack(">H", bytes(data_blk[:even])):
+            crc = wide[crc ^ word]
+        data_blk = data_blk[even:]
     for data in data_blk:
-        i = ((crc_accum >> 8) ^ data) & 0xFF
-        crc_accum = ((crc_accum << 8) ^ CRC_TABLE[i]) & 0xFFFF
-    return crc_accum
+        crc = ((crc << 8) ^ table[((crc >> 8) ^ data) & 0xFF]) & 0xFFFF
+    return crc
+
+
+# Byte stuffing keeps the header pattern out of packet payloads
+_HEADER_BYTES = bytes(HEADER)
+_STUFFED_HEADER_BYTES = _HEADER_BYTES + b"\xfd"
+
+
+def make_instruction_packet(servo_id: int, instruction: int, params: bytes = b"") -> bytes:
+    """
+    Encode a Protocol 2.0 instruction packet.
+    
+    Args:
+        servo_id: Target servo ID
+        instruction: Instruction code
+        params: Instruction parameters
+        
+    Returns:
+        bytes: Complete packet including CRC
+    """
+    params = params.replace(_HEADER_BYTES, _STUFFED_HEADER_BYTES)
+    length = len(params) + 3  # instruction + CRC
+    packet = bytearray(_HEADER_BYTES)
+    packet += bytes([RESERVED, servo_id, length & 0xFF, length >> 8, instruction])
+    packet += params
+    crc = update_crc(0, packet)
+    packet += bytes([crc & 0xFF, crc >> 8])
+    return bytes(packet)
+
+
+# struct formats for little-endian control table values, indexed by size in bytes
+_VALUE_FORMATS = (None, "<B", "<H", None, "<I")
+
+
+def pack_value(buf: bytearray, offset: int, value: int, size: int) -> None:
+    """
+    Pack a control table value into buf at offset.
+    
+    Args:
+        buf: Buffer to write into
+        offset: Position of the first byte
+        value: Raw value (negative values are written in two's complement)
+        size: Size in bytes (1, 2 or 4)
+    """
+    struct.pack_into(_VALUE_FORMATS[size], buf, offset, value & ((1 << (8 * size)) - 1))
+
+
+def to_signed(value: int, size: int) -> int:
+    """
+    Reinterpret an unsigned control table value as two's complement.
+    
+    Args:
+        value: Raw value as returned by the SDK (already negative values are kept)
+        size: Size in bytes (1, 2 or 4)
+        
+    Returns:
+        int: Signed value
+    """
+    half = 1 << (8 * size - 1)
+    return value - (half << 1) if value >= half else value
+
+
+class StatusPacket(NamedTuple):
+    """A decoded status packet."""
+    servo_id: int
+    error: int
+    params: bytes
+
+
+class StatusPacketParser:
+    """
+    Incremental parser for Protocol 2.0 status packets.
+    
+    Bytes can be fed in arbitrary chunks as they arrive; anything that is not
+    part of a status packet is skipped. Packets are framed by searching for
+    the header and slicing by the length field, so the work done in Python
+    is per packet rather than per byte.
+    """
+    
+    def __init__(self):
+        self.reset()
+        
+    def reset(self) -> None:
+        """Discard any partially received packet."""
+        self._buffer = bytearray()
+        
+    def feed(self, data: bytes) -> List[Optional[StatusPacket]]:
+        """
+        Parse received bytes.
+        
+        Args:
+            data: Received bytes
+            
+        Returns:
+            List of completed packets, with None for packets that failed the CRC check
+        """
+        buffer = self._buffer
+        buffer += data
+        packets = []
+        while True:
+            start = buffer.find(_HEADER_BYTES)
+            if start < 0:
+                # Keep a trailing partial header
+                keep = 2 if buffer.endswith(b"\xff\xff") else 1 if buffer.endswith(b"\xff") else 0
+                del buffer[:len(buffer) - keep]
+                break
+            if start:
+                del buffer[:start]
+            if len(buffer) < 8:
+                break
+            length = buffer[5] | (buffer[6] << 8)
+            if (
+                buffer[3] != RESERVED
+                or not 4 <= length <= MAX_PACKET_LENGTH
+                or buffer[7] != Instruction.STATUS
+            ):
+                del buffer[:len(_HEADER_BYTES)]
+                continue
+            end = 7 + length
+            if len(buffer) < end:
+                break
+            packets.append(self._finish_packet(buffer, end))
+            del buffer[:end]
+        return packets
+        
+    @staticmethod
+    def _finish_packet(buffer: bytearray, end: int) -> Optional[StatusPacket]:
+        # Work on a view of the receive buffer rather than slicing copies of it;
+        # the view must be released before the buffer is resized
+        with memoryview(buffer) as view:
+            crc = update_crc(0, view[:end - 2])
+            if buffer[end - 2] != crc & 0xFF or buffer[end - 1] != crc >> 8:
+                return None
+            params = view[9:end - 2].tobytes()
+        if _HEADER_BYTES in params:
+            params = params.replace(_STUFFED_HEADER_BYTES, _HEADER_BYTES)
+        return StatusPacket(buffer[4], buffer[8], params)
 
 
 class ErrorBit(IntEnum):
@@ -82,17 +255,21 @@ class ErrorBit(IntEnum):
     OVERLOAD = 0x10
     
     @classmethod
-    def decode(cls, error_byte: int) -> set:
+    def decode(cls, error_byte: int) -> FrozenSet[str]:
         """Decode error byte into set of error conditions."""
-        errors = set()
-        if error_byte & cls.INPUT_VOLTAGE:
-            errors.add("Input Voltage Error")
-        if error_byte & cls.OVERHEATING:
-            errors.add("Overheating Error")
-        if error_byte & cls.MOTOR_ENCODER:
-            errors.add("Motor Encoder Error")
-        if error_byte & cls.ELECTRICAL_SHOCK:
-            errors.add("Electrical Shock Error")
-        if error_byte & cls.OVERLOAD:
-            errors.add("Overload Error")
-        return errors 
\ No newline at end of file
+        return _ERROR_SETS[error_byte & 0x1F]
+
+
+_ERROR_NAMES = (
+    (ErrorBit.INPUT_VOLTAGE, "Input Voltage Error"),
+    (ErrorBit.OVERHEATING, "Overheating Error"),
+    (ErrorBit.MOTOR_ENCODER, "Motor Encoder Error"),
+    (ErrorBit.ELECTRICAL_SHOCK, "Electrical Shock Error"),
+    (ErrorBit.OVERLOAD, "Overload Error"),
+)
+
+# Decoded error conditions for every combination of the five error bits
+_ERROR_SETS: Tuple[FrozenSet[str], ...] = tuple(
+    frozenset(name for bit, name in _ERROR_NAMES if error_byte & bit)
+    for error_byte in range(32)
+)
@@ -1,41 +1,268 @@
 """High-level interface for individual Dynamixel servos."""
 
+import asyncio
+import concurrent.futures
+import functools
 import logging
-from typing import Optional, Any, Dict, Tuple
-from dynamixel_sdk.robotis_def import COMM_SUCCESS
+from typing import (
+    TYPE_CHECKING, Optional, Any, Awaitable, Callable, Dict, Iterable, List, Sequence, Tuple,
+    Union
+)
+from dynamixel_sdk.robotis_def import (
+    COMM_PORT_BUSY,
+    COMM_RX_CORRUPT,
+    COMM_RX_TIMEOUT,
+    COMM_SUCCESS,
+    COMM_TX_FAIL
+)
 from dynamixel_sdk.port_handler import PortHandler
 from dynamixel_sdk.packet_handler import PacketHandler
-from .constants import OperatingMode
+from .constants import OperatingMode, PROTOCOL_2
+from .protocol import (
+    HEADER, RESERVED, STATUS_PACKET_LENGTH, Instruction, StatusPacketParser, update_crc
+)
 from .models import DynamixelModel, SUPPORTED_MODELS
-from .exceptions import DynamixelServoError, DynamixelModelError
+from .exceptions import DynamixelServoError, DynamixelModelError, DynamixelTxError
+
+if TYPE_CHECKING:
+    from .controller import DynamixelController
 
 logger = logging.getLogger(__name__)
 
+# Items that never change or only change through writes from this host,
+# so they are read from the bus once and then served from the read cache
+_CACHEABLE_ITEMS = frozenset({
+    "MODEL_NUMBER",
+    "MODEL_INFORMATION",
+    "FIRMWARE_VERSION",
+    "OPERATING_MODE",
+    "DRIVE_MODE",
+    "CURRENT_LIMIT",
+})
+
+# I/O thread for servos used without a controller, created on first use.
+# A single worker keeps their transactions from overlapping on a shared port.
+_standalone_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+# Marks a read cache miss, since cached values may be falsy
+_MISSING = object()
+
+# Operating mode bit in DynamixelModel.feature_mask for current sensing and limits
+_CURRENT_MODE_BIT = 1 << OperatingMode.CURRENT
+
+# (address, size, validate, to_raw, from_raw, write_txn, read_txn, name), where the
+# transactions are SDK functions with port handler, servo ID and address bound
+_CachedItem = Tuple[
+    int, int, Callable, Optional[Callable], Optional[Callable], Callable, Callable, str
+]
+
+# Item cache keyed by item name. Lookups also take register tokens, which
+# miss and fall back to _lookup_token.
+_ItemCache = Dict[Union[str, int], _CachedItem]
+
 class DynamixelServo:
+    __slots__ = (
+        "port_handler",
+        "packet_handler",
+        "id",
+        "controller",
+        "_model",
+        "_write_fns",
+        "_read_fns",
+        "_item_cache",
+        "_token_items",
+        "_read_cache",
+        "_goal_position_template",
+        "_goal_position_crc",
+        "_write_torque_enable",
+        "_write_goal_position",
+        "_write_goal_velocity",
+        "_write_goal_pwm",
+    )
+    
     def __init__(
         self,
         port_handler: PortHandler,
         packet_handler: PacketHandler,
         servo_id: int,
-        model: Optional[DynamixelModel] = None
+        model: Optional[DynamixelModel] = None,
+        controller: Optional["DynamixelController"] = None
     ):
         self.port_handler = port_handler
         self.packet_handler = packet_handler
         self.id = servo_id
+        self.controller = controller
+        # SDK transaction functions indexed by item size in bytes
+        self._write_fns = (
+            None, packet_handler.write1ByteTxRx, packet_handler.write2ByteTxRx,
+            None, packet_handler.write4ByteTxRx
+        )
+        self._read_fns = (
+            None, packet_handler.read1ByteTxRx, packet_handler.read2ByteTxRx,
+            None, packet_handler.read4ByteTxRx
+        )
         self.model = model
         
+    @property
+    def model(self) -> Optional[DynamixelModel]:
+        return self._model
+        
+    @model.setter
+    def model(self, model: Optional[DynamixelModel]) -> None:
+        self._model = model
+        self._item_cache = self._build_item_cache(model) if model else {}
+        self._token_items: Tuple[Optional[_CachedItem], ...] = (
+            tuple(self._item_cache.get(name) for name in model._names) if model else ()
+        )
+        self._read_cache: Dict[str, Any] = {}
+        self._goal_position_template: Optional[bytearray] = None
+        self._goal_position_crc = 0
+        # The packet is encoded for the protocol the handler actually speaks,
+        # which may differ from the model's native protocol
+        if (
+            model
+            and "GOAL_POSITION" in self._item_cache
+            and self.packet_handler.getProtocolVersion() == PROTOCOL_2
+        ):
+            self._build_goal_position_template(self._item_cache["GOAL_POSITION"][0])
+        self._write_torque_enable = self._make_writer("TORQUE_ENABLE")
+        self._write_goal_position = self._make_writer("GOAL_POSITION")
+        self._write_goal_velocity = self._make_writer("GOAL_VELOCITY")
+        self._write_goal_pwm = self._make_writer("GOAL_PWM")
+        
+    def _make_writer(self, item_name: Union[str, int]) -> Callable[[Any], Awaitable[bool]]:
+        """
+        Build a writer for one item with its address, converter and SDK function bound.
+        
+        Used for the goal and torque items written in control loops. Falls back
+        to _write_to_address, which raises the appropriate error, when the model
+        doesn't have the item. The item must not be in _CACHEABLE_ITEMS.
+        """
+        if item_name not in self._item_cache:
+            return functools.partial(self._write_to_address, item_name)
+        _, _, validate, to_raw, _, transaction, _, item_name = self._item_cache[item_name]
+        
+        async def write(value: Any) -> bool:
+            raw = to_raw(value) if to_raw else value
+            if not validate(raw):
+                raise self._out_of_range_error(value, item_name)
+            result, error = await self._txrx(transaction, raw)
+            if result != COMM_SUCCESS or error:
+                self._check(result, error, "write", item_name)
+            return True
+        return write
+        
+    def _build_item_cache(self, model: DynamixelModel) -> _ItemCache:
+        """Resolve address, size, converters and bound SDK transactions once per item."""
+        write_fns, read_fns = self._write_fns, self._read_fns
+        
+        cache: _ItemCache = {}
+        for name, idx in model._name_to_idx.items():
+            address, size = model._addr[idx], model._size[idx]
+            if size >= len(write_fns) or write_fns[size] is None:
+                continue
+            to_raw, from_raw = model.get_value_converters(name)
+            cache[name] = (
+                address,
+                size,
+                model.get_validator(name),
+                to_raw,
+                from_raw,
+                functools.partial(write_fns[size], self.port_handler, self.id, address),
+                functools.partial(read_fns[size], self.port_handler, self.id, address),
+                name
+            )
+        return cache
+        
+    def _build_goal_position_template(self, address: int) -> None:
+        """Pre-encode the WRITE packet for GOAL_POSITION, leaving payload and CRC blank."""
+        length = 2 + 4 + 3  # address + data + instruction/crc
+        prefix = bytes(HEADER) + bytes([
+            RESERVED, self.id, length & 0xFF, length >> 8,
+            Instruction.WRITE, address & 0xFF, address >> 8
+        ])
+        self._goal_position_template = bytearray(prefix) + bytearray(6)
+        self._goal_position_crc = update_crc(0, prefix)
+        
+    def _unknown_item_error(self, item_name: Union[str, int]) -> Exception:
+        if not self.model:
+            return DynamixelModelError("No model detected for this servo", servo_id=self.id)
+        return DynamixelServoError(f"Unknown control table item {item_name!r}", self.id)
+        
+    def _out_of_range_error(self, value: Any, item_name: str) -> Exception:
+        return DynamixelServoError(f"Value {value} is outside valid range for {item_name}", self.id)
+        
+    def _lookup_token(self, token: Union[str, int]) -> _CachedItem:
+        """
+        Look up an item not found by name, which must be a token of the servo's model.
+        
+        Tokens of another model's REGISTERS enum are rejected, as their values
+        index a different control table.
+        
+        Raises:
+            DynamixelModelError: If no model has been detected
+            DynamixelServoError: If the item is unknown or the token isn't the model's
+        """
+        model = self._model
+        entry = None
+        if model is not None and type(token) is model.REGISTERS:
+            entry = self._token_items[token]
+        if entry is None:
+            raise self._unknown_item_error(token)
+        return entry
+        
+    async def _txrx(self, fn: Callable, *args: Any) -> Any:
+        """Run an SDK transaction without blocking the event loop."""
+        global _standalone_executor
+        try:
+            if self.controller is not None:
+                return await self.controller._txrx(fn, *args)
+            if asyncio.iscoroutinefunction(fn):
+                return await fn(*args)
+            if _standalone_executor is None:
+                _standalone_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="dynamixel-io"
+                )
+            return await asyncio.get_running_loop().run_in_executor(
+                _standalone_executor, fn, *args
+            )
+        except OSError as e:
+            # Includes serial.SerialException; protocol failures come back as result codes
+            raise DynamixelServoError(f"Serial I/O error: {e}", self.id) from e
+            
+    def _check(self, result: int, error: int, action: str, item_name: str) -> None:
+        """
+        Raise if a transaction failed or the servo reported an error.
+        
+        Nothing is logged here, so callers handling the exception decide
+        whether to log it.
+        """
+        if result != COMM_SUCCESS or error:
+            raise DynamixelTxError(
+                result, item_name, self.id,
+                error=error, action=action, packet_handler=self.packet_handler
+            )
+        
     @classmethod
     async def detect_model(
         cls,
         port_handler: PortHandler,
         packet_handler: PacketHandler,
-        servo_id: int
+        servo_id: int,
+        controller: Optional["DynamixelController"] = None
     ) -> Optional[DynamixelModel]:
         
         try:
-            # Create temporary servo instance to read model number
-            temp_servo = cls(port_handler, packet_handler, servo_id)
-            model_number = await temp_servo._read_from_address("MODEL_NUMBER")
+            # Ping replies with the model number, which needs no model to read
+            temp_servo = cls(port_handler, packet_handler, servo_id, controller=controller)
+            model_number, result, error = await temp_servo._txrx(
+                packet_handler.ping, port_handler, servo_id
+            )
+            if result != COMM_SUCCESS:
+                logger.debug(
+                    f"No response from servo {servo_id}: {packet_handler.getTxRxResult(result)}"
+                )
+                return None
             if model_number in SUPPORTED_MODELS:
                 return SUPPORTED_MODELS[model_number]
             logger.warning(f"Unknown model number: {model_number}")
@@ -44,149 +271,336 @@ class DynamixelServo:
             logger.debug(f"Could not detect model for servo {servo_id}: {e}")
             return None
             
-    def _write_to_address(self, item_name: str, value: Any) -> bool:
-        try:
-            if not self.model:
-                raise DynamixelModelError("No model detected for this servo")
-                
-            item = self.model.get_control_table_item(item_name)
+    async def _write_to_address(self, item_name: Union[str, int], value: Any) -> bool:
+        entry = self._item_cache.get(item_name)
+        if entry is None:
+            entry = self._lookup_token(item_name)
+        _, _, validate, to_raw, from_raw, write_txn, _, item_name = entry
             
-            if not item.validate_value(value):
-                raise ValueError(f"Value {value} is outside valid range for {item_name}")
-                
-            # Convert value if needed
-            if item.value_converter:
-                value = item.value_converter(value)
-                
-            # Choose write function based on size
-            if item.size == 1:
-                result, error = self.packet_handler.write1ByteTxRx(
-                    self.port_handler, self.id, item.address, value)
-            elif item.size == 2:
-                result, error = self.packet_handler.write2ByteTxRx(
-                    self.port_handler, self.id, item.address, value)
-            elif item.size == 4:
-                result, error = self.packet_handler.write4ByteTxRx(
-                    self.port_handler, self.id, item.address, value)
+        raw = to_raw(value) if to_raw else value
+        if not validate(raw):
+            raise self._out_of_range_error(value, item_name)
+            
+        result, error = await self._txrx(write_txn, raw)
+        if result != COMM_SUCCESS or error:
+            self._check(result, error, "write", item_name)
+            
+        if item_name in _CACHEABLE_ITEMS:
+            self._read_cache[item_name] = from_raw(raw) if from_raw else raw
+        return True
+        
+    async def _read_from_address(self, item_name: Union[str, int]) -> Optional[Any]:
+        entry = self._item_cache.get(item_name)
+        if entry is None:
+            entry = self._lookup_token(item_name)
+        _, _, _, _, from_raw, _, read_txn, item_name = entry
+        
+        read_cache = self._read_cache
+        value = read_cache.get(item_name, _MISSING)
+        if value is not _MISSING:
+            return value
+            
+        value, result, error = await self._txrx(read_txn)
+        if result != COMM_SUCCESS or error:
+            self._check(result, error, "read", item_name)
+            
+        if from_raw:
+            value = from_raw(value)
+        if item_name in _CACHEABLE_ITEMS:
+            read_cache[item_name] = value
+        return value
+        
+    def _encode_item(self, item_name: Union[str, int], value: Any) -> Tuple[int, bytes, Any, str]:
+        """Validate a value and encode it as little-endian bytes for its item."""
+        entry = self._item_cache.get(item_name)
+        if entry is None:
+            entry = self._lookup_token(item_name)
+        address, size, validate, to_raw, from_raw, _, _, item_name = entry
+            
+        raw = to_raw(value) if to_raw else value
+        if not validate(raw):
+            raise self._out_of_range_error(value, item_name)
+        data = (int(raw) & ((1 << (8 * size)) - 1)).to_bytes(size, "little")
+        return address, data, from_raw(raw) if from_raw else raw, item_name
+        
+    async def _write_block(self, address: int, data: bytes, description: str) -> bool:
+        """Write raw bytes starting at address in a single transaction."""
+        result, error = await self._txrx(
+            self.packet_handler.writeTxRx,
+            self.port_handler, self.id, address, len(data), list(data)
+        )
+        if result != COMM_SUCCESS or error:
+            self._check(result, error, "write", description)
+        return True
+        
+    async def _write_items(self, values: Sequence[Tuple[Union[str, int], Any]]) -> bool:
+        """Write several items, using one transaction per run of adjacent items."""
+        encoded = sorted(self._encode_item(name, value) for name, value in values)
+        
+        runs: List[Tuple[int, bytearray, List[str]]] = []
+        for address, data, _, name in encoded:
+            if runs and runs[-1][0] + len(runs[-1][1]) == address:
+                runs[-1][1].extend(data)
+                runs[-1][2].append(name)
             else:
-                raise ValueError(f"Unsupported item size: {item.size}")
+                runs.append((address, bytearray(data), [name]))
                 
-            if result != COMM_SUCCESS:
-                raise DynamixelServoError(
-                    self.id,
-                    f"Failed to write {item_name}: {self.packet_handler.getTxRxResult(result)}"
-                )
-            if error != 0:
-                raise DynamixelServoError(
-                    self.id,
-                    f"Servo error writing {item_name}: {self.packet_handler.getRxPacketError(error)}"
-                )
-                
-            return True
+        for address, data, names in runs:
+            await self._write_block(address, data, ", ".join(names))
             
-        except Exception as e:
-            logger.error(f"Error writing to servo {self.id}: {str(e)}")
-            raise DynamixelServoError(self.id, str(e))
+        for _, _, cached, name in encoded:
+            if name in _CACHEABLE_ITEMS:
+                self._read_cache[name] = cached
+        return True
+        
+    async def write_many(self, values: Dict[Union[str, int], Any]) -> bool:
+        """
+        Write several items, using one transaction per run of adjacent items.
+        
+        Args:
+            values: Values by item name or register token, in the same units as
+                the single-item setters
             
-    def _read_from_address(self, item_name: str) -> Optional[Any]:
-        try:
-            if not self.model:
-                raise DynamixelModelError("No model detected for this servo")
-                
-            item = self.model.get_control_table_item(item_name)
+        Returns:
+            bool: True if successful
+        """
+        return await self._write_items(list(values.items()))
+        
+    async def read_many(self, item_names: Iterable[Union[str, int]]) -> Dict[str, Any]:
+        """
+        Read several items, using one transaction per group of nearby items.
+        
+        Items closer together than a status packet's overhead are read in the
+        same transaction, since the extra bytes cost less than another round trip.
+        
+        Args:
+            item_names: Names or register tokens of the items to read
             
-            # Choose read function based on size
-            if item.size == 1:
-                result, value, error = self.packet_handler.read1ByteTxRx(
-                    self.port_handler, self.id, item.address)
-            elif item.size == 2:
-                result, value, error = self.packet_handler.read2ByteTxRx(
-                    self.port_handler, self.id, item.address)
-            elif item.size == 4:
-                result, value, error = self.packet_handler.read4ByteTxRx(
-                    self.port_handler, self.id, item.address)
+        Returns:
+            Dict[str, Any]: Values by item name, in the same units as the single-item getters
+        """
+        values: Dict[str, Any] = {}
+        items = []
+        for name in item_names:
+            entry = self._item_cache.get(name)
+            if entry is None:
+                entry = self._lookup_token(name)
+            address, size, _, _, from_raw, _, _, name = entry
+            if name in self._read_cache:
+                values[name] = self._read_cache[name]
+                continue
+            items.append((address, size, name, from_raw))
+        items.sort(key=lambda item: item[0])
+        
+        runs: List[Tuple[int, int, list]] = []
+        for item in items:
+            address, size = item[0], item[1]
+            if runs and address - runs[-1][1] <= STATUS_PACKET_LENGTH:
+                start, end, run_items = runs[-1]
+                runs[-1] = (start, max(end, address + size), run_items + [item])
             else:
-                raise ValueError(f"Unsupported item size: {item.size}")
-                
-            if result != COMM_SUCCESS:
-                raise DynamixelServoError(
-                    self.id,
-                    f"Failed to read {item_name}: {self.packet_handler.getTxRxResult(result)}"
-                )
-            if error != 0:
-                raise DynamixelServoError(
-                    self.id,
-                    f"Servo error reading {item_name}: {self.packet_handler.getRxPacketError(error)}"
-                )
-                
-            # Convert value if needed
-            if item.value_converter and value is not None:
-                value = item.value_converter(value)
+                runs.append((address, address + size, [item]))
                 
-            return value
+        for start, end, run_items in runs:
+            data, result, error = await self._txrx(
+                self.packet_handler.readTxRx, self.port_handler, self.id, start, end - start
+            )
+            if result != COMM_SUCCESS or error:
+                self._check(result, error, "read", ", ".join(item[2] for item in run_items))
+            for address, size, name, from_raw in run_items:
+                offset = address - start
+                value = int.from_bytes(bytes(data[offset:offset + size]), "little")
+                if from_raw:
+                    value = from_raw(value)
+                if name in _CACHEABLE_ITEMS:
+                    self._read_cache[name] = value
+                values[name] = value
+        return values
+        
+    async def configure(
+        self,
+        operating_mode: Optional[OperatingMode] = None,
+        current_limit: Optional[float] = None,
+        velocity_limit: Optional[float] = None,
+        torque: Optional[bool] = None
+    ) -> bool:
+        """
+        Apply several setup items.
+        
+        The operating mode and limits are EEPROM items, which can only be written
+        while torque is disabled. Torque is disabled first, then each item is
+        written (adjacent items share a write, but on the XM430 these three are
+        apart, so that is one write per item), and torque is left disabled
+        unless torque is True.
+        
+        Args:
+            operating_mode: Operating mode to set
+            current_limit: Current limit in mA
+            velocity_limit: Velocity limit in RPM
+            torque: True to enable torque once configured
             
-        except Exception as e:
-            logger.error(f"Error reading from servo {self.id}: {str(e)}")
-            raise DynamixelServoError(self.id, str(e))
+        Returns:
+            bool: True if successful
+        """
+        if operating_mode is not None:
+            self._check_operating_mode(operating_mode)
+            
+        values = [
+            (name, value) for name, value in (
+                ("OPERATING_MODE", operating_mode),
+                ("CURRENT_LIMIT", current_limit),
+                ("VELOCITY_LIMIT", velocity_limit),
+            ) if value is not None
+        ]
+        if values:
+            await self._write_torque_enable(0)
+            await self._write_items(values)
+            if torque:
+                await self._write_torque_enable(1)
+        elif torque is not None:
+            await self._write_torque_enable(1 if torque else 0)
+        return True
+        
+    async def set_goal_block(
+        self,
+        position: float,
+        velocity_profile: Optional[float] = None,
+        acceleration_profile: Optional[float] = None
+    ) -> bool:
+        """
+        Set goal position together with its motion profile.
+        
+        PROFILE_ACCELERATION (108), PROFILE_VELOCITY (112) and GOAL_POSITION (116)
+        are adjacent in the control table, so any run of them is sent in a single
+        transaction. Giving acceleration_profile without velocity_profile leaves a
+        gap, and takes two transactions.
+        
+        Args:
+            position: Goal position in degrees
+            velocity_profile: Profile velocity in RPM
+            acceleration_profile: Profile acceleration (raw units)
             
+        Returns:
+            bool: True if successful
+        """
+        values = [("GOAL_POSITION", position)]
+        if velocity_profile is not None:
+            values.append(("PROFILE_VELOCITY", velocity_profile))
+        if acceleration_profile is not None:
+            values.append(("PROFILE_ACCELERATION", acceleration_profile))
+        return await self._write_items(values)
+        
     # High-level control methods
-    def enable_torque(self) -> bool:
-        return self._write_to_address("TORQUE_ENABLE", 1)
+    async def enable_torque(self) -> bool:
+        return await self._write_torque_enable(1)
+        
+    async def disable_torque(self) -> bool:
+        return await self._write_torque_enable(0)
+        
+    async def set_position(self, position_degrees: float) -> bool:
+        return await self._write_goal_position(position_degrees)
+        
+    async def get_position(self) -> Optional[float]:
+        return await self._read_from_address("PRESENT_POSITION")
+        
+    async def set_position_fast(self, position_degrees: float) -> bool:
+        """
+        Set goal position using a pre-encoded instruction packet.
+        
+        Only the position bytes and the CRC over them are computed per call,
+        which suits high-rate control loops. Falls back to set_position when
+        the packet handler doesn't speak Protocol 2.0.
         
-    def disable_torque(self) -> bool:
-        return self._write_to_address("TORQUE_ENABLE", 0)
+        Args:
+            position_degrees: Goal position in degrees
+            
+        Returns:
+            bool: True if successful
+        """
+        if self._goal_position_template is None:
+            return await self.set_position(position_degrees)
+            
+        _, _, validate, to_raw, _, _, _, _ = self._item_cache["GOAL_POSITION"]
+        raw = to_raw(position_degrees)
+        # The valid range also keeps the payload free of bytes needing stuffing
+        if not validate(raw):
+            raise self._out_of_range_error(position_degrees, "GOAL_POSITION")
+            
+        packet = self._goal_position_template
+        payload = raw.to_bytes(4, "little", signed=True)
+        packet[-6:-2] = payload
+        crc = update_crc(self._goal_position_crc, payload)
+        packet[-2] = crc & 0xFF
+        packet[-1] = crc >> 8
         
-    def set_position(self, position_degrees: float) -> bool:
-        return self._write_to_address("GOAL_POSITION", position_degrees)
+        result, error = await self._txrx(self._send_write_packet, bytes(packet))
+        if result != COMM_SUCCESS or error:
+            self._check(result, error, "write", "GOAL_POSITION")
+        return True
+        
+    def _send_write_packet(self, packet: bytes) -> Tuple[int, int]:
+        """Send an encoded WRITE packet and wait for its status packet."""
+        port = self.port_handler
+        if port.is_using:
+            return COMM_PORT_BUSY, 0
+        port.is_using = True
+        try:
+            port.clearPort()
+            if port.writePort(packet) != len(packet):
+                return COMM_TX_FAIL, 0
+                
+            # Like the SDK's rxPacket, skip bytes ahead of the status packet
+            port.setPacketTimeout(STATUS_PACKET_LENGTH)
+            parser = StatusPacketParser()
+            while True:
+                for status in parser.feed(bytes(port.readPort(STATUS_PACKET_LENGTH))):
+                    if status is None:
+                        return COMM_RX_CORRUPT, 0
+                    if status.servo_id == self.id:
+                        return COMM_SUCCESS, status.error
+                if port.isPacketTimeout():
+                    return COMM_RX_TIMEOUT, 0
+        finally:
+            port.is_using = False
         
-    def get_position(self) -> Optional[float]:
-        return self._read_from_address("PRESENT_POSITION")
+    async def set_operating_mode(self, mode: OperatingMode) -> bool:
+        self._check_operating_mode(mode)
+        return await self._write_to_address("OPERATING_MODE", mode)
         
-    def set_operating_mode(self, mode: OperatingMode) -> bool:
+    def _check_operating_mode(self, mode: OperatingMode) -> None:
         if not self.model:
             raise DynamixelModelError("No model detected for this servo")
             
-        mode_feature_map = {
-            OperatingMode.CURRENT: "current_control",
-            OperatingMode.VELOCITY: "velocity_control",
-            OperatingMode.POSITION: "position_control",
-            OperatingMode.EXTENDED_POSITION: "extended_position",
-            OperatingMode.CURRENT_BASED_POSITION: "current_based_position",
-            OperatingMode.PWM: "pwm_control"
-        }
-        
-        feature = mode_feature_map.get(mode)
-        if not feature or not self.model.supports_feature(feature):
+        if not self.model.feature_mask >> mode & 1:
             raise DynamixelServoError(
-                self.id,
-                f"Operating mode {mode.name} not supported by {self.model.name}"
+                f"Operating mode {mode.name} not supported by {self.model.name}",
+                self.id
             )
-            
-        return self._write_to_address("OPERATING_MODE", mode)
         
-    def get_current(self) -> Optional[float]:
-        if not self.model or not self.model.supports_feature("current_control"):
+    async def get_current(self) -> Optional[float]:
+        if not self.model or not self.model.feature_mask & _CURRENT_MODE_BIT:
             raise DynamixelServoError(
-                self.id,
-                "Current reading not supported by this model"
+                "Current reading not supported by this model",
+                self.id
             )
-        return self._read_from_address("PRESENT_CURRENT")
+        return await self._read_from_address("PRESENT_CURRENT")
         
-    def set_current_limit(self, current_ma: float) -> bool:
-        if not self.model or not self.model.supports_feature("current_control"):
+    async def set_current_limit(self, current_ma: float) -> bool:
+        """Set the current limit, in mA (stored in 2.69 mA units, rounded down)."""
+        if not self.model or not self.model.feature_mask & _CURRENT_MODE_BIT:
             raise DynamixelServoError(
-                self.id,
-                "Current control not supported by this model"
+                "Current control not supported by this model",
+                self.id
             )
-        return self._write_to_address("CURRENT_LIMIT", current_ma)
+        return await self._write_to_address("CURRENT_LIMIT", current_ma)
         
-    def get_current_limit(self) -> Optional[float]:
-        if not self.model or not self.model.supports_feature("current_control"):
+    async def get_current_limit(self) -> Optional[float]:
+        if not self.model or not self.model.feature_mask & _CURRENT_MODE_BIT:
             raise DynamixelServoError(
-                self.id,
-                "Current control not supported by this model"
+                "Current control not supported by this model",
+                self.id
             )
-        return self._read_from_address("CURRENT_LIMIT")
+        return await self._read_from_address("CURRENT_LIMIT")
         
     def get_model_info(self) -> Dict[str, Any]:
         if not self.model:
@@ -198,65 +612,63 @@ class DynamixelServo:
             "features": list(self.model.features)
         }
 
-    def set_velocity(self, velocity_rpm: float) -> bool:
-        return self._write_to_address("GOAL_VELOCITY", velocity_rpm)
+    async def set_velocity(self, velocity_rpm: float) -> bool:
+        return await self._write_goal_velocity(velocity_rpm)
         
-    def get_velocity(self) -> Optional[float]:
-        return self._read_from_address("PRESENT_VELOCITY")
+    async def get_velocity(self) -> Optional[float]:
+        return await self._read_from_address("PRESENT_VELOCITY")
 
-    def set_pwm(self, pwm_value: int) -> bool:
-        return self._write_to_address("GOAL_PWM", pwm_value)
+    async def set_pwm(self, pwm_value: int) -> bool:
+        return await self._write_goal_pwm(pwm_value)
         
-    def get_pwm(self) -> Optional[int]:
-        return self._read_from_address("PRESENT_PWM")
+    async def get_pwm(self) -> Optional[int]:
+        return await self._read_from_address("PRESENT_PWM")
 
-    def set_led(self, on: bool) -> bool:
-        return self._write_to_address("LED", 1 if on else 0)
+    async def set_led(self, on: bool) -> bool:
+        return await self._write_to_address("LED", 1 if on else 0)
 
-    def set_profile_velocity(self, velocity_rpm: float) -> bool:
-        return self._write_to_address("PROFILE_VELOCITY", velocity_rpm)
+    async def set_profile_velocity(self, velocity_rpm: float) -> bool:
+        return await self._write_to_address("PROFILE_VELOCITY", velocity_rpm)
         
-    def set_profile_acceleration(self, acceleration: float) -> bool:
-        return self._write_to_address("PROFILE_ACCELERATION", acceleration)
+    async def set_profile_acceleration(self, acceleration: float) -> bool:
+        return await self._write_to_address("PROFILE_ACCELERATION", acceleration)
         
-    def get_profile_velocity(self) -> Optional[float]:
-        return self._read_from_address("PROFILE_VELOCITY")
+    async def get_profile_velocity(self) -> Optional[float]:
+        return await self._read_from_address("PROFILE_VELOCITY")
         
-    def get_profile_acceleration(self) -> Optional[float]:
-        return self._read_from_address("PROFILE_ACCELERATION")
+    async def get_profile_acceleration(self) -> Optional[float]:
+        return await self._read_from_address("PROFILE_ACCELERATION")
 
-    def get_temperature(self) -> Optional[float]:
-        return self._read_from_address("PRESENT_TEMPERATURE")
+    async def get_temperature(self) -> Optional[float]:
+        return await self._read_from_address("PRESENT_TEMPERATURE")
         
-    def get_voltage(self) -> Optional[float]:
-        return self._read_from_address("PRESENT_INPUT_VOLTAGE")
+    async def get_voltage(self) -> Optional[float]:
+        return await self._read_from_address("PRESENT_INPUT_VOLTAGE")
         
-    def get_load(self) -> Optional[float]:
-        return self._read_from_address("PRESENT_LOAD")
+    async def get_load(self) -> Optional[float]:
+        return await self._read_from_address("PRESENT_LOAD")
         
-    def is_moving(self) -> bool:
-        return bool(self._read_from_address("MOVING"))
+    async def is_moving(self) -> bool:
+        return bool(await self._read_from_address("MOVING"))
 
-    def set_position_gains(self, p: int, i: int = 0, d: int = 0) -> bool:
-        success = True
-        success &= self._write_to_address("POSITION_P_GAIN", p)
-        success &= self._write_to_address("POSITION_I_GAIN", i)
-        success &= self._write_to_address("POSITION_D_GAIN", d)
-        return success
-        
-    def get_position_gains(self) -> Tuple[int, int, int]:
-        p = self._read_from_address("POSITION_P_GAIN") or 0
-        i = self._read_from_address("POSITION_I_GAIN") or 0
-        d = self._read_from_address("POSITION_D_GAIN") or 0
-        return (p, i, d)
-        
-    def set_velocity_gains(self, p: int, i: int = 0) -> bool:
-        success = True
-        success &= self._write_to_address("VELOCITY_P_GAIN", p)
-        success &= self._write_to_address("VELOCITY_I_GAIN", i)
-        return success
-        
-    def get_velocity_gains(self) -> Tuple[int, int]:
-        p = self._read_from_address("VELOCITY_P_GAIN") or 0
-        i = self._read_from_address("VELOCITY_I_GAIN") or 0
-        return (p, i) 
\ No newline at end of file
+    async def set_position_gains(self, p: int, i: int = 0, d: int = 0) -> bool:
+        return await self.write_many({
+            "POSITION_P_GAIN": p,
+            "POSITION_I_GAIN": i,
+            "POSITION_D_GAIN": d
+        })
+        
+    async def get_position_gains(self) -> Tuple[int, int, int]:
+        gains = await self.read_many(("POSITION_P_GAIN", "POSITION_I_GAIN", "POSITION_D_GAIN"))
+        return (
+            gains["POSITION_P_GAIN"] or 0,
+            gains["POSITION_I_GAIN"] or 0,
+            gains["POSITION_D_GAIN"] or 0
+        )
+        
+    async def set_velocity_gains(self, p: int, i: int = 0) -> bool:
+        return await self.write_many({"VELOCITY_P_GAIN": p, "VELOCITY_I_GAIN": i})
+        
+    async def get_velocity_gains(self) -> Tuple[int, int]:
+        gains = await self.read_many(("VELOCITY_P_GAIN", "VELOCITY_I_GAIN"))
+        return (gains["VELOCITY_P_GAIN"] or 0, gains["VELOCITY_I_GAIN"] or 0) 
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""Event-loop driven packet transport for Protocol 2.0."""
+
+import asyncio
+import logging
+import os
+from typing import Any, List, Optional, Tuple
+from dynamixel_sdk.port_handler import PortHandler
+from dynamixel_sdk.packet_handler import PacketHandler
+from dynamixel_sdk.robotis_def import (
+    COMM_RX_CORRUPT,
+    COMM_RX_FAIL,
+    COMM_RX_TIMEOUT,
+    COMM_SUCCESS,
+    COMM_TX_FAIL
+)
+from .protocol import (
+    STATUS_PACKET_LENGTH,
+    Instruction,
+    StatusPacket,
+    StatusPacketParser,
+    make_instruction_packet
+)
+
+logger = logging.getLogger(__name__)
+
+# Allowance on top of wire time for the adapter and servo to respond,
+# matching the SDK's packet timeout margin (2 x 16ms latency timer + 2ms)
+_RESPONSE_MARGIN = 0.034
+
+# Size of the reusable receive buffer, matching the chunk size of a single read
+_RX_BUFFER_SIZE = 4096
+
+
+class PacketTransport:
+    """
+    Sends instruction packets and resolves their status packets on the event loop.
+    
+    Incoming bytes are parsed by a reader callback on the serial file
+    descriptor, so no thread waits on the port. Callers must ensure only one
+    instruction is outstanding at a time, as the bus is half-duplex.
+    
+    If reading the port fails or hits end of file (for example when the
+    adapter is unplugged), the transport closes itself and further
+    transactions fail without touching the port.
+    """
+    
+    def __init__(self, port_handler: PortHandler):
+        self.port_handler = port_handler
+        self._fd = port_handler.ser.fileno()  # pyserial opens it non-blocking
+        self._parser = StatusPacketParser()
+        self._pending: Optional[Tuple[int, asyncio.Future]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._byte_time = 10.0 / port_handler.getBaudRate()
+        self._rx = bytearray(_RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx)
+        self.closed = False
+    
+    def start(self) -> None:
+        """Start parsing incoming bytes on the running event loop."""
+        if self.closed:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._parser.reset()
+        self._loop.add_reader(self._fd, self._on_readable)
+    
+    def stop(self) -> None:
+        """Stop reading so the port can be used for blocking I/O."""
+        if self._loop:
+            self._loop.remove_reader(self._fd)
+            self._loop = None
+        if self._pending and not self._pending[1].done():
+            self._pending[1].set_result(None)
+        self._pending = None
+    
+    def _close(self, result: int) -> None:
+        """Stop reading a failed port and fail the outstanding transaction with result."""
+        self.closed = True
+        if self._loop:
+            self._loop.remove_reader(self._fd)
+            self._loop = None
+        if self._pending and not self._pending[1].done():
+            self._pending[1].set_result(result)
+    
+    def _on_readable(self) -> None:
+        try:
+            count = os.readv(self._fd, (self._rx,))
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # The fd stays readable after a hardware error, so stop watching it
+            logger.error(f"Error reading from port, closing transport: {e}")
+            self._close(COMM_RX_FAIL)
+            return
+        if count == 0:
+            logger.error("Port reached end of file, closing transport")
+            self._close(COMM_RX_FAIL)
+            return
+        
+        for packet in self._parser.feed(self._rx_view[:count]):
+            pending = self._pending
+            if pending is None or pending[1].done():
+                continue
+            servo_id, future = pending
+            if packet is None:
+                future.set_result(COMM_RX_CORRUPT)
+            elif packet.servo_id == servo_id:
+                future.set_result(packet)
+    
+    async def transact(
+        self, servo_id: int, instruction: int, params: bytes = b"", response_length: int = 0
+    ) -> Tuple[Optional[StatusPacket], int]:
+        """
+        Send an instruction packet and wait for its status packet.
+        
+        Args:
+            servo_id: Target servo ID
+            instruction: Instruction code
+            params: Instruction parameters
+            response_length: Expected number of parameter bytes in the reply
+        
+        Returns:
+            Tuple of (status packet or None, SDK communication result)
+        """
+        if self.closed:
+            return None, COMM_TX_FAIL
+        packet = make_instruction_packet(servo_id, instruction, params)
+        future = self._loop.create_future()
+        self._pending = (servo_id, future)
+        try:
+            view = memoryview(packet)
+            while view:
+                try:
+                    view = view[os.write(self._fd, view):]
+                except BlockingIOError:
+                    await asyncio.sleep(0)
+                except OSError as e:
+                    logger.error(f"Error writing to port: {e}")
+                    return None, COMM_TX_FAIL
+            
+            wire_bytes = len(packet) + STATUS_PACKET_LENGTH + response_length
+            timeout = wire_bytes * self._byte_time + _RESPONSE_MARGIN
+            try:
+                result = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self._parser.reset()
+                return None, COMM_RX_TIMEOUT
+        finally:
+            self._pending = None
+        
+        if isinstance(result, StatusPacket):
+            return result, COMM_SUCCESS
+        return None, result if result is not None else COMM_RX_TIMEOUT
+
+
+class PipelinedPacketHandler:
+    """
+    Coroutine versions of the SDK's single-servo transactions over a PacketTransport.
+    
+    Method names and return values match the SDK PacketHandler, so servos can
+    use either interchangeably through their controller.
+    """
+    
+    def __init__(self, transport: PacketTransport, packet_handler: PacketHandler):
+        self.transport = transport
+        self.packet_handler = packet_handler
+    
+    def getProtocolVersion(self) -> float:
+        return self.packet_handler.getProtocolVersion()
+    
+    def getTxRxResult(self, result: int) -> str:
+        return self.packet_handler.getTxRxResult(result)
+    
+    def getRxPacketError(self, error: int) -> str:
+        return self.packet_handler.getRxPacketError(error)
+    
+    async def ping(self, port: Any, dxl_id: int) -> Tuple[int, int, int]:
+        status, result = await self.transport.transact(dxl_id, Instruction.PING, response_length=3)
+        if result != COMM_SUCCESS:
+            return 0, result, 0
+        return int.from_bytes(status.params[:2], "little"), result, status.error
+    
+    async def readTxRx(
+        self, port: Any, dxl_id: int, address: int, length: int
+    ) -> Tuple[List[int], int, int]:
+        params = bytes([address & 0xFF, address >> 8, length & 0xFF, length >> 8])
+        status, result = await self.transport.transact(
+            dxl_id, Instruction.READ, params, response_length=length
+        )
+        if result != COMM_SUCCESS:
+            return [], result, 0
+        if len(status.params) != length:
+            return [], COMM_RX_CORRUPT, status.error
+        return list(status.params), result, status.error
+    
+    async def _read_value(self, dxl_id: int, address: int, length: int) -> Tuple[int, int, int]:
+        data, result, error = await self.readTxRx(None, dxl_id, address, length)
+        return (int.from_bytes(bytes(data), "little") if data else 0), result, error
+    
+    async def read1ByteTxRx(self, port: Any, dxl_id: int, address: int) -> Tuple[int, int, int]:
+        return await self._read_value(dxl_id, address, 1)
+    
+    async def read2ByteTxRx(self, port: Any, dxl_id: int, address: int) -> Tuple[int, int, int]:
+        return await self._read_value(dxl_id, address, 2)
+    
+    async def read4ByteTxRx(self, port: Any, dxl_id: int, address: int) -> Tuple[int, int, int]:
+        return await self._read_value(dxl_id, address, 4)
+    
+    async def writeTxRx(
+        self, port: Any, dxl_id: int, address: int, length: int, data: List[int]
+    ) -> Tuple[int, int]:
+        params = bytes([address & 0xFF, address >> 8]) + bytes(data[:length])
+        status, result = await self.transport.transact(dxl_id, Instruction.WRITE, params)
+        return result, status.error if status else 0
+    
+    async def _write_value(self, dxl_id: int, address: int, length: int, value: int) -> Tuple[int, int]:
+        data = (int(value) & ((1 << (8 * length)) - 1)).to_bytes(length, "little")
+        return await self.writeTxRx(None, dxl_id, address, length, list(data))
+    
+    async def write1ByteTxRx(self, port: Any, dxl_id: int, address: int, data: int) -> Tuple[int, int]:
+        return await self._write_value(dxl_id, address, 1, data)
+    
+    async def write2ByteTxRx(self, port: Any, dxl_id: int, address: int, data: int) -> Tuple[int, int]:
+        return await self._write_value(dxl_id, address, 2, data)
+    
+    async def write4ByteTxRx(self, port: Any, dxl_id: int, address: int, data: int) -> Tuple[int, int]:
+        return await self._write_value(dxl_id, address, 4, data)
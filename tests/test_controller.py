@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from dynamixel_async import DynamixelController, DynamixelTimeoutError, fan_out
+from dynamixel_async import controller as controller_module
+from dynamixel_sdk.group_sync_read import GroupSyncRead
+from dynamixel_sdk.group_sync_write import GroupSyncWrite
+from dynamixel_sdk.packet_handler import PacketHandler
+from dynamixel_sdk.protocol2_packet_handler import Protocol2PacketHandler
+
+@pytest.fixture
+def controller():
+    controller = DynamixelController(port="/dev/null")
+    controller.port_handler = Mock()
+    # Restricting the mock to the SDK's methods makes a misspelled handler call fail
+    controller.packet_handler = Mock(spec=Protocol2PacketHandler)
+    controller.packet_handler.getTxRxResult.return_value = "Success"
+    controller.packet_handler.ping.return_value = (1030, 0, 0)
+    return controller
+
+@pytest.mark.asyncio
+async def test_servo_io_runs_off_event_loop(controller):
+    io_threads = []
+    def read4(port, servo_id, address):
+        io_threads.append(threading.get_ident())
+        return 2048, 0, 0
+    controller.packet_handler.read4ByteTxRx.side_effect = read4
+    
+    assert await controller.scan_servos([1]) == {1}
+    assert await controller.get_servo(1).get_position() == 180.0
+    assert io_threads and io_threads[0] != threading.get_ident()
+
+@pytest.mark.asyncio
+async def test_scan_minimizes_return_delay(controller):
+    controller.packet_handler.read1ByteTxRx.return_value = (250, 0, 0)
+    controller.packet_handler.write1ByteTxRx.return_value = (0, 0)
+    await controller.scan_servos([1], minimize_delay=True)
+    controller.packet_handler.write1ByteTxRx.assert_called_once_with(
+        controller.port_handler, 1, 9, 0
+    )
+
+@pytest.mark.asyncio
+async def test_scan_pings_small_id_sets_one_at_a_time(controller):
+    assert await controller.scan_servos([1, 2, 3, 4]) == {1, 2, 3, 4}
+    controller.packet_handler.broadcastPing.assert_not_called()
+    assert controller.packet_handler.ping.call_count == 4
+
+@pytest.mark.asyncio
+async def test_scan_broadcasts_for_large_id_sets(controller):
+    controller.packet_handler.broadcastPing.return_value = ({1: [1030, 45], 99: [1030, 45]}, 0)
+    assert await controller.scan_servos(list(range(1, 64))) == {1}
+    controller.packet_handler.broadcastPing.assert_called_once_with(controller.port_handler)
+    controller.packet_handler.ping.assert_not_called()
+
+def test_find_port_prefers_vendor_id():
+    ports = [
+        Mock(vid=None, device="/dev/ttyUSB0"),
+        Mock(vid=0x0403, device="/dev/ttyUSB1"),
+    ]
+    controller_module._port_cache = None
+    with patch("serial.tools.list_ports.comports", return_value=ports) as comports:
+        assert controller_module.find_dynamixel_port() == "/dev/ttyUSB1"
+        assert controller_module.find_dynamixel_port() == "/dev/ttyUSB1"
+    comports.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_wait_for_servos_polls_until_stopped(controller):
+    await controller.scan_servos([1])
+    profile = {"PROFILE_VELOCITY": 0, "GOAL_POSITION": 0, "PRESENT_POSITION": 0}
+    controller._group_read_items = AsyncMock(side_effect=[
+        {1: profile}, {1: {"MOVING": 1}}, {1: {"MOVING": 1}}, {1: {"MOVING": 0}},
+    ])
+    assert await controller.wait_for_servos(timeout=1.0)
+    assert controller._group_read_items.call_count == 4
+
+@pytest.mark.asyncio
+async def test_fan_out_across_controllers(controller):
+    other = DynamixelController(port="/dev/null")
+    other.port_handler = Mock()
+    other.packet_handler = Mock(spec=Protocol2PacketHandler)
+    other.packet_handler.ping.return_value = (1030, 0, 0)
+    await controller.scan_servos([1])
+    await other.scan_servos([2, 3])
+    
+    results = await fan_out([controller, other], AsyncMock(side_effect=lambda servo: servo.id))
+    assert results == [[1], [2, 3]]
+
+@pytest.mark.asyncio
+async def test_sync_write_packet_matches_sdk(controller):
+    await controller.scan_servos([1, 2])
+    controller.port_handler.is_using = False
+    controller.port_handler.writePort.side_effect = len
+    
+    assert await controller._group_write("GOAL_POSITION", {1: 90.0, 2: 270.0})
+    
+    sdk_port = Mock(is_using=False)
+    sdk_port.writePort.side_effect = len
+    writer = GroupSyncWrite(sdk_port, PacketHandler(2.0), 116, 4)
+    writer.addParam(1, [0x00, 0x04, 0x00, 0x00])
+    writer.addParam(2, [0x00, 0x0C, 0x00, 0x00])
+    writer.txPacket()
+    assert controller.port_handler.writePort.call_args[0][0] == bytes(sdk_port.writePort.call_args[0][0])
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("read_back,expected", [({1: 1, 2: 1}, True), ({1: 1, 2: 0}, False)])
+async def test_set_all_torque_confirms_with_read_back(controller, read_back, expected):
+    await controller.scan_servos([1, 2])
+    controller.port_handler.is_using = False
+    controller.port_handler.writePort.side_effect = len
+    controller._group_read = AsyncMock(return_value=read_back)
+    
+    assert await controller.set_all_torque(True) is expected
+    controller.port_handler.writePort.assert_called_once()
+    controller._group_read.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_read_present_state_returns_columns(controller):
+    await controller.scan_servos([1, 2])
+    raw = {"PRESENT_PWM": 0, "PRESENT_LOAD": 0, "PRESENT_INPUT_VOLTAGE": 120, "PRESENT_TEMPERATURE": 30}
+    controller._group_read_items = AsyncMock(return_value={
+        1: dict(raw, PRESENT_VELOCITY=0, PRESENT_POSITION=1024),
+        2: dict(raw, PRESENT_VELOCITY=100, PRESENT_POSITION=2048),
+    })
+    
+    state = await controller.read_present_state()
+    assert state["ID"] == [1, 2]
+    assert state["PRESENT_POSITION"] == [90.0, 180.0]
+    assert state["PRESENT_VELOCITY"] == pytest.approx([0.0, 22.9])
+    assert state["PRESENT_TEMPERATURE"] == [30, 30]
+
+@pytest.mark.asyncio
+async def test_read_present_state_decodes_signed_items(controller):
+    await controller.scan_servos([1])
+    raw = {124: 0xFFF6, 126: 0xFFF6, 128: 0xFFFFFF9C, 132: 2048, 144: 120, 146: 30}
+    reader = Mock()
+    reader.txRxPacket.return_value = 0
+    reader.getData.side_effect = lambda servo_id, address, size: raw[address]
+    with patch.object(controller_module, "GroupSyncRead", return_value=reader):
+        state = await controller.read_present_state()
+    assert state["PRESENT_PWM"] == [-10]
+    assert state["PRESENT_LOAD"] == [-10]
+    assert state["PRESENT_VELOCITY"] == pytest.approx([-22.9])
+    assert state["PRESENT_POSITION"] == [180.0]
+
+@pytest.mark.asyncio
+async def test_wait_for_servos_protocol_1_reads_each_servo(controller):
+    await controller.scan_servos([1])
+    controller.protocol_version = 1.0
+    controller.packet_handler.read1ByteTxRx.return_value = (0, 0, 0)  # Not moving
+    with patch.object(controller_module, "GroupSyncRead") as group_sync_read:
+        assert await controller.wait_for_servos(timeout=0.1)
+    group_sync_read.assert_not_called()
+    controller.packet_handler.read1ByteTxRx.assert_called_once_with(controller.port_handler, 1, 122)
+
+@pytest.mark.asyncio
+async def test_sync_read_polls_only_requested_ids(controller):
+    await controller.scan_servos([1, 2])
+    polled = []
+    def tx_rx_packet(reader):
+        polled.append(sorted(reader.data_dict))
+        return 0
+    with patch.object(GroupSyncRead, "txRxPacket", autospec=True, side_effect=tx_rx_packet), \
+            patch.object(GroupSyncRead, "isAvailable", return_value=True), \
+            patch.object(GroupSyncRead, "getData", return_value=0):
+        await controller.read_present_state([1, 2])
+        await controller.read_present_state([2])
+    assert polled == [[1, 2], [2]]
+
+@pytest.mark.asyncio
+async def test_wait_for_servos_times_out_despite_long_estimate(controller):
+    await controller.scan_servos([1])
+    controller._estimate_move_time = AsyncMock(return_value=30.0)
+    controller._any_moving = AsyncMock(return_value=True)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(DynamixelTimeoutError):
+        await controller.wait_for_servos(timeout=0.2)
+    assert loop.time() - start < 0.5
+    # Backoff starts at the minimum interval, not at a fraction of the estimate
+    assert controller._any_moving.await_count > 3
@@ -1,57 +1,327 @@
+import re
+import threading
+from enum import IntEnum
 import pytest
 from unittest.mock import Mock, patch
+from dynamixel_sdk.protocol1_packet_handler import Protocol1PacketHandler
 from dynamixel_async import (
-    DynamixelServo, DynamixelError, DynamixelModelError,
-    XM430W210, OperatingMode
+    DynamixelServo, DynamixelError, DynamixelModelError, DynamixelTxError,
+    XM430W210Model, OperatingMode, Register
 )
 
-@pytest.fixture
+# Expected error messages, compiled once for pytest.raises(match=...)
+_WRITE_FAILED_RE = re.compile(r"failed to write torque_enable", re.I)
+_NO_MODEL_RE = re.compile(r"no model detected", re.I)
+
+# The suite can run in parallel with pytest-xdist (``pytest -n auto``), which
+# creates module-scoped fixtures once per worker process. Those below hold
+# either read-only data, such as model instances, or handler stand-ins that
+# _reset_handlers clears before each test; per-test state belongs in
+# function-scoped fixtures.
+@pytest.fixture(scope="module")
 def mock_port_handler():
     return Mock()
 
-@pytest.fixture
+class StubPacketHandler:
+    """
+    Stand-in for the SDK PacketHandler with plain methods.
+    
+    Each method counts its call in ``counts``, appends ``(name, args, kwargs)``
+    to ``calls`` for tests that check arguments, and returns ``returns[name]``.
+    A preset exception is raised instead, and a preset function is called
+    with the arguments. Writes succeed unless told otherwise. The result and
+    error descriptions are fixed class attributes and are not recorded.
+    """
+    
+    DEFAULT_RETURNS = {
+        "write1ByteTxRx": (0, 0),
+        "write2ByteTxRx": (0, 0),
+        "write4ByteTxRx": (0, 0),
+        "writeTxRx": (0, 0),
+    }
+    
+    getProtocolVersion = staticmethod(lambda: 2.0)
+    getTxRxResult = staticmethod(lambda result: "Success")
+    getRxPacketError = staticmethod(lambda error: 0)
+    
+    def __init__(self):
+        self.reset()
+        
+    def reset(self):
+        self.returns = dict(self.DEFAULT_RETURNS)
+        self.counts = {}
+        self.calls = []
+        
+    def _call(self, name, args, kwargs):
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.calls.append((name, args, kwargs))
+        ret = self.returns[name]
+        if isinstance(ret, BaseException):
+            raise ret
+        return ret(*args, **kwargs) if callable(ret) else ret
+        
+    def ping(self, *args, **kwargs):
+        return self._call("ping", args, kwargs)
+        
+    def read1ByteTxRx(self, *args, **kwargs):
+        return self._call("read1ByteTxRx", args, kwargs)
+        
+    def read2ByteTxRx(self, *args, **kwargs):
+        return self._call("read2ByteTxRx", args, kwargs)
+        
+    def read4ByteTxRx(self, *args, **kwargs):
+        return self._call("read4ByteTxRx", args, kwargs)
+        
+    def readTxRx(self, *args, **kwargs):
+        return self._call("readTxRx", args, kwargs)
+        
+    def write1ByteTxRx(self, *args, **kwargs):
+        return self._call("write1ByteTxRx", args, kwargs)
+        
+    def write2ByteTxRx(self, *args, **kwargs):
+        return self._call("write2ByteTxRx", args, kwargs)
+        
+    def write4ByteTxRx(self, *args, **kwargs):
+        return self._call("write4ByteTxRx", args, kwargs)
+        
+    def writeTxRx(self, *args, **kwargs):
+        return self._call("writeTxRx", args, kwargs)
+        
+    def calls_to(self, name):
+        return [args for called, args, _ in self.calls if called == name]
+        
+    def assert_called_once(self, name):
+        assert self.counts.get(name) == 1, self.counts
+        
+    def assert_not_called(self, name):
+        assert name not in self.counts, self.counts
+
+@pytest.fixture(scope="module")
 def mock_packet_handler():
-    handler = Mock()
-    handler.getTxRxResult.return_value = "Success"
-    handler.getRxPacketError.return_value = 0
-    return handler
+    return StubPacketHandler()
+
+@pytest.fixture(autouse=True)
+def _reset_handlers(mock_port_handler, mock_packet_handler):
+    # The handlers are shared across the module; clear what the last test set up
+    mock_port_handler.reset_mock(return_value=True, side_effect=True)
+    mock_packet_handler.reset()
+
+@pytest.fixture(scope="module")
+def xm430_model():
+    return XM430W210Model()
 
 @pytest.fixture
-def servo(mock_port_handler, mock_packet_handler):
+def servo(mock_port_handler, mock_packet_handler, xm430_model):
     servo = DynamixelServo(mock_port_handler, mock_packet_handler, servo_id=1)
-    servo.model = XM430W210()
+    servo.model = xm430_model
     return servo
 
+@pytest.fixture(scope="module")
+def modelless_servo(mock_port_handler, mock_packet_handler):
+    # Only used for error paths, which leave no state behind
+    return DynamixelServo(mock_port_handler, mock_packet_handler, servo_id=1)
+
 def test_servo_initialization(servo):
     assert servo.id == 1
-    assert isinstance(servo.model, XM430W210)
-
-def test_enable_torque(servo, mock_packet_handler):
-    mock_packet_handler.write1ByteTxRx.return_value = (0, 0)  # Success
-    assert servo.enable_torque()
-    mock_packet_handler.write1ByteTxRx.assert_called_once()
-
-def test_set_position(servo, mock_packet_handler):
-    mock_packet_handler.write4ByteTxRx.return_value = (0, 0)  # Success
-    assert servo.set_position(180.0)
-    mock_packet_handler.write4ByteTxRx.assert_called_once()
-
-def test_get_position(servo, mock_packet_handler):
-    mock_packet_handler.read4ByteTxRx.return_value = (0, 2048, 0)  # Success, mid position
-    assert servo.get_position() == 180.0
-    mock_packet_handler.read4ByteTxRx.assert_called_once()
-
-def test_set_operating_mode(servo, mock_packet_handler):
-    mock_packet_handler.write1ByteTxRx.return_value = (0, 0)  # Success
-    assert servo.set_operating_mode(OperatingMode.POSITION)
-    mock_packet_handler.write1ByteTxRx.assert_called_once()
-
-def test_error_handling(servo, mock_packet_handler):
-    mock_packet_handler.write1ByteTxRx.return_value = (1, 0)  # Communication error
+    assert isinstance(servo.model, XM430W210Model)
+
+# (servo method, args, packet handler function, its return value, expected result)
+CASES = [
+    ("enable_torque", (), "write1ByteTxRx", (0, 0), True),
+    ("set_position", (180.0,), "write4ByteTxRx", (0, 0), True),
+    ("set_operating_mode", (OperatingMode.POSITION,), "write1ByteTxRx", (0, 0), True),
+    ("get_position", (), "read4ByteTxRx", (2048, 0, 0), 180.0),  # Mid position
+    ("get_velocity", (), "read4ByteTxRx", (0xFFFFFF9C, 0, 0), -100 * 0.229),  # Reverse
+]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name,args,attr,ret,expected", CASES)
+async def test_single_transaction_success(servo, mock_packet_handler, name, args, attr, ret, expected):
+    mock_packet_handler.returns[attr] = ret
+    assert await getattr(servo, name)(*args) == expected
+    assert mock_packet_handler.counts == {attr: 1}
+
+@pytest.mark.asyncio
+async def test_unsupported_operating_mode(servo, mock_packet_handler):
     with pytest.raises(DynamixelError):
-        servo.enable_torque()
+        await servo.set_operating_mode(OperatingMode.CURRENT_BASED_POSITION)
+    mock_packet_handler.assert_not_called("write1ByteTxRx")
 
-def test_no_model_error(mock_port_handler, mock_packet_handler):
-    servo = DynamixelServo(mock_port_handler, mock_packet_handler, servo_id=1)
-    with pytest.raises(DynamixelModelError):
-        servo.enable_torque() 
\ No newline at end of file
+@pytest.mark.asyncio
+async def test_error_handling(servo, mock_packet_handler):
+    mock_packet_handler.returns["write1ByteTxRx"] = (1, 0)  # Communication error
+    with pytest.raises(DynamixelError, match=_WRITE_FAILED_RE):
+        await servo.enable_torque()
+
+@pytest.mark.asyncio
+async def test_tx_error_message_is_lazy(servo, mock_packet_handler, monkeypatch):
+    described = []
+    def get_tx_rx_result(result):
+        described.append(result)
+        return "[TxRxResult] There is no status packet!"
+    monkeypatch.setattr(mock_packet_handler, "getTxRxResult", get_tx_rx_result)
+    mock_packet_handler.returns["write1ByteTxRx"] = (-3001, 0)
+    with pytest.raises(DynamixelTxError) as exc_info:
+        await servo.enable_torque()
+    assert not described
+    assert str(exc_info.value) == (
+        "Failed to write TORQUE_ENABLE: [TxRxResult] There is no status packet! (servo ID: 1)"
+    )
+
+@pytest.mark.asyncio
+async def test_serial_io_error_is_chained(servo, mock_packet_handler):
+    mock_packet_handler.returns["write1ByteTxRx"] = OSError("device disconnected")
+    with pytest.raises(DynamixelError) as exc_info:
+        await servo.enable_torque()
+    assert isinstance(exc_info.value.__cause__, OSError)
+
+@pytest.mark.asyncio
+async def test_no_model_error(modelless_servo):
+    with pytest.raises(DynamixelModelError, match=_NO_MODEL_RE):
+        await modelless_servo.enable_torque()
+
+@pytest.mark.asyncio
+async def test_value_out_of_range(servo, mock_packet_handler):
+    with pytest.raises(DynamixelError):
+        await servo.set_position(400.0)
+    mock_packet_handler.assert_not_called("write4ByteTxRx")
+
+@pytest.mark.asyncio
+async def test_cached_item_read_once(servo, mock_packet_handler):
+    mock_packet_handler.returns["read1ByteTxRx"] = (3, 0, 0)  # Position mode
+    assert await servo._read_from_address("OPERATING_MODE") == 3
+    assert await servo._read_from_address("OPERATING_MODE") == 3
+    mock_packet_handler.assert_called_once("read1ByteTxRx")
+
+@pytest.mark.asyncio
+async def test_cached_item_write_through(servo, mock_packet_handler):
+    await servo.set_operating_mode(OperatingMode.VELOCITY)
+    assert await servo._read_from_address("OPERATING_MODE") == OperatingMode.VELOCITY
+    mock_packet_handler.assert_not_called("read1ByteTxRx")
+
+@pytest.mark.asyncio
+async def test_register_token_shares_name_cache(servo, mock_packet_handler):
+    await servo._write_to_address(Register.OPERATING_MODE, OperatingMode.VELOCITY)
+    assert await servo._read_from_address("OPERATING_MODE") == OperatingMode.VELOCITY
+    assert mock_packet_handler.calls == [("write1ByteTxRx", (servo.port_handler, 1, 11, 1), {})]
+
+@pytest.mark.asyncio
+async def test_foreign_register_tokens_rejected(servo, mock_packet_handler, xm430_model):
+    OtherRegister = IntEnum("OtherRegister", [("TORQUE_ENABLE", int(Register.LED))])
+    with pytest.raises(DynamixelError):
+        await servo._write_to_address(OtherRegister.TORQUE_ENABLE, 1)
+    with pytest.raises(DynamixelError):
+        await servo._write_to_address(int(Register.LED), 1)
+    with pytest.raises(KeyError):
+        xm430_model.validate_value(int(Register.LED), 1)
+    assert mock_packet_handler.calls == []
+
+@pytest.mark.asyncio
+async def test_configure_writes_eeprom_items_with_torque_off(servo, mock_packet_handler):
+    await servo.configure(
+        operating_mode=OperatingMode.VELOCITY, current_limit=538, velocity_limit=100, torque=True
+    )
+    port = servo.port_handler
+    assert [(name, args) for name, args, _ in mock_packet_handler.calls] == [
+        ("write1ByteTxRx", (port, 1, 64, 0)),
+        ("writeTxRx", (port, 1, 11, 1, [1])),
+        ("writeTxRx", (port, 1, 38, 2, [200, 0])),  # 538 mA in 2.69 mA units
+        ("writeTxRx", (port, 1, 44, 4, [0xB4, 0x01, 0x00, 0x00])),
+        ("write1ByteTxRx", (port, 1, 64, 1)),
+    ]
+    assert await servo._read_from_address("OPERATING_MODE") == OperatingMode.VELOCITY
+
+@pytest.mark.asyncio
+async def test_current_limit_in_ma(servo, mock_packet_handler):
+    await servo.set_current_limit(500)
+    assert mock_packet_handler.calls_to("write2ByteTxRx") == [(servo.port_handler, 1, 38, 185)]
+    assert await servo.get_current_limit() == pytest.approx(185 * 2.69)
+
+@pytest.mark.asyncio
+async def test_set_goal_block(servo, mock_packet_handler):
+    await servo.set_goal_block(180.0, acceleration_profile=10, velocity_profile=0)
+    mock_packet_handler.assert_called_once("writeTxRx")
+    _, _, address, length, data = mock_packet_handler.calls_to("writeTxRx")[0]
+    assert (address, length, data[8:]) == (108, 12, [0, 8, 0, 0])
+
+@pytest.mark.asyncio
+async def test_set_goal_block_without_velocity_profile(servo, mock_packet_handler):
+    await servo.set_goal_block(180.0, acceleration_profile=10)
+    writes = mock_packet_handler.calls_to("writeTxRx")
+    assert [(address, length) for _, _, address, length, _ in writes] == [(108, 4), (116, 4)]
+
+@pytest.mark.asyncio
+async def test_set_position_fast(servo, mock_port_handler):
+    status = bytes([0xFF, 0xFF, 0xFD, 0x00, 0x01, 0x04, 0x00, 0x55, 0x00, 0xA1, 0x0C])
+    mock_port_handler.is_using = False
+    mock_port_handler.writePort.side_effect = len
+    # Leading noise is skipped, as by the SDK
+    mock_port_handler.readPort.side_effect = [b"\x00\xff", status]
+    mock_port_handler.isPacketTimeout.return_value = False
+    assert await servo.set_position_fast(180.0)
+    packet = mock_port_handler.writePort.call_args[0][0]
+    assert packet == bytes([
+        0xFF, 0xFF, 0xFD, 0x00, 0x01, 0x09, 0x00, 0x03,
+        0x74, 0x00, 0x00, 0x08, 0x00, 0x00, 0x42, 0x89
+    ])
+
+@pytest.mark.asyncio
+async def test_set_position_fast_follows_handler_protocol(mock_port_handler, xm430_model):
+    packet_handler = Mock(spec=Protocol1PacketHandler)
+    packet_handler.getProtocolVersion.return_value = 1.0
+    packet_handler.write4ByteTxRx.return_value = (0, 0)
+    servo = DynamixelServo(mock_port_handler, packet_handler, servo_id=1, model=xm430_model)
+    assert await servo.set_position_fast(180.0)
+    packet_handler.write4ByteTxRx.assert_called_once_with(mock_port_handler, 1, 116, 2048)
+    mock_port_handler.writePort.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_position_gains_single_read(servo, mock_packet_handler):
+    mock_packet_handler.returns["readTxRx"] = ([0x80, 0x02, 0x00, 0x00, 0x0A, 0x00], 0, 0)
+    assert await servo.get_position_gains() == (10, 0, 640)  # D, I, P are at 80, 82, 84
+    assert mock_packet_handler.calls == [("readTxRx", (servo.port_handler, 1, 80, 6), {})]
+
+@pytest.mark.asyncio
+async def test_read_many_decodes_signed_items(servo, mock_packet_handler):
+    # PRESENT_LOAD = -10, PRESENT_VELOCITY = -100
+    mock_packet_handler.returns["readTxRx"] = ([0xF6, 0xFF, 0x9C, 0xFF, 0xFF, 0xFF], 0, 0)
+    values = await servo.read_many(("PRESENT_LOAD", "PRESENT_VELOCITY"))
+    assert values == {"PRESENT_LOAD": -10, "PRESENT_VELOCITY": -100 * 0.229}
+
+@pytest.mark.asyncio
+async def test_detect_model_without_controller_runs_off_event_loop(mock_port_handler, mock_packet_handler):
+    io_threads = []
+    def ping(port, servo_id):
+        io_threads.append(threading.get_ident())
+        return 1030, 0, 0
+    mock_packet_handler.returns["ping"] = ping
+    
+    model = await DynamixelServo.detect_model(mock_port_handler, mock_packet_handler, 1)
+    assert isinstance(model, XM430W210Model)
+    assert io_threads and io_threads[0] != threading.get_ident()
+
+def test_control_table_is_read_only(xm430_model):
+    with pytest.raises(TypeError):
+        xm430_model.control_table["LED"] = xm430_model.control_table["TORQUE_ENABLE"]
+    with pytest.raises(AttributeError):
+        xm430_model.control_table["LED"].address = 64
+
+def test_features_are_read_only(xm430_model):
+    with pytest.raises(AttributeError):
+        xm430_model.features.discard("current_control")
+    assert xm430_model.has_feature("current_control")
+
+def test_batch_conversions_match_scalar(xm430_model):
+    model = xm430_model
+    positions = [0, 1024, 2048, 4095]
+    assert model.positions_to_degrees(positions) == [model.position_to_degrees(p) for p in positions]
+    assert model.velocities_to_rpm((-100, 0, 100)) == [model.velocity_to_rpm(v) for v in (-100, 0, 100)]
+    with pytest.raises(TypeError):
+        model.velocities_to_rpm([100, None])
+
+@pytest.mark.asyncio
+async def test_set_position_gains_single_write(servo, mock_packet_handler):
+    assert await servo.set_position_gains(800, 0, 10)
+    assert mock_packet_handler.calls == [
+        ("writeTxRx", (servo.port_handler, 1, 80, 6, [0x0A, 0x00, 0x00, 0x00, 0x20, 0x03]), {})
+    ]
@@ -0,0 +1,96 @@
+import errno
+import os
+import pty
+import tty
+import pytest
+from unittest.mock import Mock, patch
+from dynamixel_sdk.robotis_def import COMM_RX_FAIL, COMM_TX_FAIL
+from dynamixel_sdk.protocol2_packet_handler import Protocol2PacketHandler
+from dynamixel_async.protocol import (
+    ErrorBit, Instruction, StatusPacket, StatusPacketParser, make_instruction_packet, update_crc
+)
+from dynamixel_async import transport as transport_module
+from dynamixel_async.transport import PacketTransport, PipelinedPacketHandler
+
+STATUS_PACKET = bytes([0xFF, 0xFF, 0xFD, 0x00, 0x01, 0x04, 0x00, 0x55, 0x00, 0xA1, 0x0C])
+
+@pytest.fixture
+def serial_pair():
+    servo_fd, port_fd = pty.openpty()
+    tty.setraw(servo_fd)
+    tty.setraw(port_fd)
+    os.set_blocking(port_fd, False)
+    port_handler = Mock()
+    port_handler.ser.fileno.return_value = port_fd
+    port_handler.getBaudRate.return_value = 57600
+    yield servo_fd, port_handler
+    os.close(servo_fd)
+    os.close(port_fd)
+
+def test_crc_matches_sdk():
+    data = bytes(range(256)) * 2 + b"\x07"
+    assert update_crc(0, data) == Protocol2PacketHandler().updateCRC(0, list(data), len(data))
+    assert update_crc(update_crc(0, data[:100]), data[100:]) == update_crc(0, data)
+
+def test_error_bits_decode():
+    assert ErrorBit.decode(0x00) == set()
+    assert ErrorBit.decode(0x80 | ErrorBit.OVERHEATING | ErrorBit.OVERLOAD) == {
+        "Overheating Error", "Overload Error"
+    }
+
+def test_parser_handles_split_and_corrupt_packets():
+    parser = StatusPacketParser()
+    corrupt = STATUS_PACKET[:-1] + b"\x00"
+    
+    assert parser.feed(b"\x00" + STATUS_PACKET[:5]) == []
+    assert parser.feed(STATUS_PACKET[5:] + corrupt) == [StatusPacket(1, 0, b""), None]
+
+def test_instruction_packet_is_byte_stuffed():
+    packet = make_instruction_packet(1, Instruction.WRITE, bytes([0x74, 0x00, 0xFF, 0xFF, 0xFD]))
+    
+    assert packet[8:14] == bytes([0x74, 0x00, 0xFF, 0xFF, 0xFD, 0xFD])
+    assert packet[5] == len(packet) - 7
+
+@pytest.mark.asyncio
+async def test_pipelined_write_resolves_status_packet(serial_pair):
+    servo_fd, port_handler = serial_pair
+    transport = PacketTransport(port_handler)
+    handler = PipelinedPacketHandler(transport, Mock(spec=Protocol2PacketHandler))
+    transport.start()
+    
+    task = handler.write1ByteTxRx(None, 1, 64, 1)
+    os.write(servo_fd, STATUS_PACKET)
+    assert await task == (0, 0)
+    assert os.read(servo_fd, 64) == make_instruction_packet(1, Instruction.WRITE, bytes([64, 0, 1]))
+    transport.stop()
+
+@pytest.mark.asyncio
+async def test_pipelined_read_times_out_without_reply(serial_pair):
+    _, port_handler = serial_pair
+    transport = PacketTransport(port_handler)
+    handler = PipelinedPacketHandler(transport, Mock(spec=Protocol2PacketHandler))
+    transport.start()
+    
+    value, result, error = await handler.read4ByteTxRx(None, 1, 132)
+    assert (value, error) == (0, 0)
+    assert result != 0
+    transport.stop()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("readv", [OSError(errno.EIO, "Input/output error"), 0])
+async def test_transport_closes_on_read_error(serial_pair, readv):
+    servo_fd, port_handler = serial_pair
+    transport = PacketTransport(port_handler)
+    handler = PipelinedPacketHandler(transport, Mock(spec=Protocol2PacketHandler))
+    transport.start()
+    
+    side_effect = readv if isinstance(readv, BaseException) else lambda fd, buffers: readv
+    with patch.object(transport_module.os, "readv", side_effect=side_effect) as os_readv:
+        task = handler.read4ByteTxRx(None, 1, 132)
+        os.write(servo_fd, b"\x00")
+        assert await task == (0, COMM_RX_FAIL, 0)
+        os_readv.assert_called_once()
+    
+    assert transport.closed
+    assert await handler.read4ByteTxRx(None, 1, 132) == (0, COMM_TX_FAIL, 0)
+    transport.stop()